@@ -15,7 +15,7 @@ from rest_framework.utils import model_meta
 from rdmo.core.constants import RDMO_MODELS
 from rdmo.core.import_helpers import ExtraFieldHelper
 from rdmo.core.utils import get_languages
-from rdmo.core.validators import LockedValidator
+from rdmo.core.validators import LockedValidator, UniqueURIValidator
 
 logger = logging.getLogger(__name__)
 
@@ -135,7 +135,7 @@ def track_changes_on_element(element: dict,
 
     if original_value is None and original is not None:
         lookup_field = element_field if instance_field is None else instance_field
-        original_value = getattr(original, lookup_field, '')
+        original_value = original.get(lookup_field, '')
 
     element[ImportElementFields.DIFF][element_field][ImportElementFields.CURRENT] = original_value
     element[ImportElementFields.DIFF][element_field][ImportElementFields.NEW] = new_value
@@ -162,11 +162,66 @@ def get_lang_field_values(field_name: str,
     return ret
 
 
+def fetch_original_values(instance: models.Model, element: dict, import_helper) -> dict:
+    """
+    Returns a snapshot of the current field values of an existing instance, which is used to track
+    the changes of the import. Related elements are stored by their uri and fetched with one query per field.
+    """
+    original = {}
+
+    for field_name in (*import_helper.common_fields, *(i.field_name for i in import_helper.extra_fields)):
+        original[field_name] = getattr(instance, field_name)
+
+    for field_name in import_helper.lang_fields:
+        for _lang_code, _lang_verbose_name, lang_field in get_languages():
+            lang_field_name = f'{field_name}_{lang_field}'
+            original[lang_field_name] = getattr(instance, lang_field_name, '')
+
+    foreign_fields = [field_name for field_name in import_helper.foreign_fields if field_name in element]
+    if foreign_fields:
+        foreign_uris = (
+            instance._meta.model.objects.filter(pk=instance.pk)
+            .values(*[f'{field_name}__uri' for field_name in foreign_fields])
+            .first()
+        ) or {}
+        for field_name in foreign_fields:
+            original[field_name] = foreign_uris.get(f'{field_name}__uri') or ''
+
+    for field_name in import_helper.m2m_instance_fields:
+        if field_name in element:
+            original[field_name] = list(getattr(instance, field_name).values_list('uri', flat=True))
+
+    for mapper in import_helper.m2m_through_instance_fields:
+        if mapper.field_name in element:
+            original[mapper.field_name] = _fetch_original_through_data(instance, mapper.field_name,
+                                                                       mapper.through_name, mapper.target_name,
+                                                                       mapper.target_name)
+
+    for mapper in import_helper.reverse_m2m_through_instance_fields:
+        if mapper.field_name in element:
+            original[mapper.field_name] = _fetch_original_through_data(instance, mapper.field_name,
+                                                                       mapper.through_name, mapper.source_name,
+                                                                       mapper.target_name)
+
+    return original
+
+
+def _fetch_original_through_data(instance, field_name, through_name, uri_name, target_name) -> list[dict]:
+    try:
+        through_values = getattr(instance, through_name).order_by().values_list(f'{uri_name}__uri', 'order')
+    except AttributeError:
+        return []  # legacy elements miss the field_name
+
+    model = get_rdmo_model_path(target_name, field_name)
+    current_data = [{'uri': uri, 'order': order, 'model': model} for uri, order in through_values]
+    return sorted(current_data, key=lambda k: k['order'])
+
+
 def set_common_fields(instance, field_name, element, original=None):
     element_value = element.get(field_name) or ''
     if field_name == 'comment' and original is not None:
         # prevent overwrite with an empty comment when updating an element
-        original_value = getattr(original, field_name)
+        original_value = original.get(field_name)
         if original_value and not element_value:
             element_value = original_value
             element[field_name] = element_value
@@ -194,10 +249,7 @@ def track_changes_on_uri_of_foreign_field(element, field_name, foreign_uri, orig
     if original is None:
         return
     # get foreign uri of original
-    original_foreign_instance = getattr(original, field_name, '')
-    original_foreign_uri = ''
-    if original_foreign_instance:
-        original_foreign_uri = getattr(original_foreign_instance, 'uri', '')
+    original_foreign_uri = original.get(field_name) or ''
     track_changes_on_element(element, field_name, new_value=foreign_uri, original_value=original_foreign_uri)
 
 
@@ -302,10 +354,8 @@ def track_changes_m2m_instances(element, field_name,
                                 foreign_instances, original=None):
     if original is None:
         return
-    original_m2m_instance = getattr(original, field_name)
-    original_m2m_instance = original_m2m_instance or []
     # m2m instance fields are unordered so comparison by set
-    original_uris = set(original_m2m_instance.values_list('uri', flat=True))
+    original_uris = set(original.get(field_name) or [])
     foreign_uris = {i.uri for i in foreign_instances}
     common_uris = list(original_uris & foreign_uris)
     original_uris_list = common_uris + list(original_uris - foreign_uris)
@@ -336,16 +386,7 @@ def set_m2m_through_instances(instance, element, field_name=None, source_name=No
 
     # get the original data in correct order
     if original is not None:
-        try:
-            for orig_field_instance in getattr(original, through_name).order_by():
-                current_data.append({
-                    'uri': getattr(orig_field_instance, target_name).uri,
-                    'order': orig_field_instance.order,
-                    'model': get_rdmo_model_path(target_name, field_name)
-                })
-            current_data = sorted(current_data, key=lambda k: k['order'])
-        except AttributeError:
-            pass  # legacy elements miss the field_name
+        current_data = original.get(field_name) or []
 
     for target_element in target_elements:
         target_uri = target_element.get('uri')
@@ -479,17 +520,7 @@ def set_reverse_m2m_through_instance(instance, element, field_name=None, source_
     current_data = []
 
     if original is not None:
-        try:
-            current_data = []
-            for _through_instance in getattr(original, through_name).order_by():
-                current_data.append({
-                    'uri': getattr(_through_instance, source_name).uri,
-                    'order': _through_instance.order,
-                    'model': get_rdmo_model_path(target_name, field_name),
-                })
-            current_data = sorted(current_data, key=lambda k: k['order'])
-        except AttributeError:
-            pass  # legacy elements miss the field_name
+        current_data = original.get(field_name) or []
 
     for target_element in target_elements:
         target_uri = target_element.get('uri')
@@ -498,7 +529,7 @@ def set_reverse_m2m_through_instance(instance, element, field_name=None, source_
         new_data.append(target_element)
 
         try:
-            target_instance = target_model.objects.get(uri=target_uri)
+            target_instance = target_model.objects.annotate_is_locked().get(uri=target_uri)
             if target_instance.is_locked:
                 message = '{target_model} {target_uri} for imported {instance_model} {instance_uri} is locked.'.format(
                     target_model=target_model._meta.object_name,
@@ -540,7 +571,7 @@ def format_message_from_validation_error(exception: ValidationError) -> str:
     return message
 
 
-def validate_instance(instance, element, *validators):
+def validate_instance(instance, element, *validators, uris=None):
     exception_message = None
     try:
         instance.full_clean()
@@ -560,8 +591,11 @@ def validate_instance(instance, element, *validators):
     for validator in validators:
         if issubclass(validator, LockedValidator):
             element['locked'] = False
+        validator_kwargs = {'instance': instance if instance.id else None}
+        if issubclass(validator, UniqueURIValidator):
+            validator_kwargs['uris'] = uris
         try:
-            validator(instance=instance if instance.id else None)(vars(instance))
+            validator(**validator_kwargs)(vars(instance))
         except ValidationError as e:
             try:
                 exception_message = format_message_from_validation_error(e)
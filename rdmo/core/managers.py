@@ -29,6 +29,24 @@ class AvailabilityQuerySetMixin:
             return self.filter(available=True)
 
 
+class LockedQuerySetMixin:
+    '''
+    Filters and annotates the elements, which are locked themselves or by one of their superior
+    elements, using the get_locked_filter method of the queryset. The annotation has the same name
+    as the is_locked property of the models, so that the property needs no further queries.
+    '''
+
+    def get_locked_filter(self):
+        return models.Q(locked=True)
+
+    def filter_locked(self):
+        return self.filter(self.get_locked_filter())
+
+    def annotate_is_locked(self):
+        return self.annotate(is_locked=models.ExpressionWrapper(self.get_locked_filter(),
+                                                               output_field=models.BooleanField()))
+
+
 class CurrentSiteManagerMixin:
 
     def filter_current_site(self):
@@ -45,3 +63,12 @@ class AvailabilityManagerMixin:
 
     def filter_availability(self, user):
         return self.get_queryset().filter_availability(user)
+
+
+class LockedManagerMixin:
+
+    def filter_locked(self):
+        return self.get_queryset().filter_locked()
+
+    def annotate_is_locked(self):
+        return self.get_queryset().annotate_is_locked()
@@ -0,0 +1,43 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    '''
+    Cursor (keyset) pagination, which filters on the ordering field instead of using OFFSET
+    and does not need a COUNT query. Only the fields in keyset_ordering_fields of the view
+    can be used for the ordering, the primary key is added to make the ordering stable.
+    '''
+
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = ('-id', )
+    ordering_param = 'ordering'
+
+    def get_ordering(self, request, queryset, view):
+        ordering_fields = getattr(view, 'keyset_ordering_fields', ('id', ))
+
+        ordering = request.query_params.get(self.ordering_param, '').strip()
+        field_name = ordering.lstrip('-')
+        if field_name not in ordering_fields:
+            return self.ordering
+        elif field_name == 'id':
+            return (ordering, )
+        else:
+            return (ordering, '-id' if ordering.startswith('-') else 'id')
+
+
+class KeysetPaginationMixin:
+    '''
+    Uses the keyset_pagination_class instead of the pagination_class, if the cursor query
+    parameter is present in the request. An empty cursor (?cursor=) returns the first page.
+    '''
+
+    keyset_pagination_class = KeysetPagination
+    keyset_ordering_fields = ('id', 'updated')
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator') and \
+                self.keyset_pagination_class.cursor_query_param in self.request.query_params:
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
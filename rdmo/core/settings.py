@@ -331,6 +331,13 @@ EXPORT_CONTENT_DISPOSITION = 'attachment'
 
 EXPORT_MIN_REQUIRED_VERSION = '2.1.0'
 
+# 'command' leaves import jobs to the run_import_jobs command, 'process' runs them in a local process pool
+MANAGEMENT_IMPORT_JOBS_WORKER = 'command'
+MANAGEMENT_IMPORT_JOBS_PROCESSES = 1
+
+# running import jobs without progress for this number of seconds are queued again by run_import_jobs
+MANAGEMENT_IMPORT_JOBS_TIMEOUT = 600
+
 MARKDOWN_TEMPLATES: dict[str, str] = {
     # for example: 'not_empty': 'core/text_blocks/template_for_not_empty.html',
 }
@@ -366,6 +373,8 @@ PROJECT_IMPORTS = [
 
 PROJECT_IMPORTS_LIST = []
 
+PROJECT_IMPORTS_BATCH_SIZE = 1000
+
 PROJECT_FILE_QUOTA = '10Mb'
 
 PROJECT_SEND_ISSUE = False
@@ -378,6 +387,12 @@ PROJECT_SEND_INVITE = True
 PROJECT_VIEWS_SYNC = False
 PROJECT_TASKS_SYNC = False
 
+# collect the tasks, views and projects to synchronize and synchronize each of them once on commit
+PROJECT_SYNC_QUEUE = True
+
+# the number of rows created or deleted per query by the sync_projects command
+PROJECT_SYNC_BATCH_SIZE = 1000
+
 PROJECT_CREATE_RESTRICTED = False
 PROJECT_CREATE_GROUPS = []
 
@@ -389,6 +404,17 @@ OPTIONSET_PROVIDERS = []
 
 PROJECT_VALUES_SEARCH_LIMIT = 10
 
+# on PostgreSQL, the searches use pg_trgm (trigram) indexes, if the extension was installed
+# before running the migrations, e.g. by a database superuser using: CREATE EXTENSION pg_trgm;
+# the indexes can also be created later, e.g. using:
+# CREATE INDEX CONCURRENTLY projects_value_text_search ON projects_value USING gin (UPPER(text::text) gin_trgm_ops);
+# CREATE INDEX CONCURRENTLY projects_project_search_document_search ON projects_project
+#     USING gin (UPPER(search_document::text) gin_trgm_ops);
+# set to True, once the extension is installed, to use the trigram functions (e.g. for ranking)
+PROJECT_SEARCH_TRIGRAM_INDEX = False
+
+PROJECT_VALUES_PAGE_SIZE = 100
+
 PROJECT_VALUES_VALIDATION = False
 
 PROJECT_VALUES_VALIDATION_URL = True
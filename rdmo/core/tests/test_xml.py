@@ -1,6 +1,15 @@
 from pathlib import Path
 
-from ..xml import flat_xml_to_elements, get_ns_map, get_ns_tag, get_uri, read_xml_file
+from ..xml import (
+    flat_xml_to_elements,
+    get_ns_map,
+    get_ns_tag,
+    get_uri,
+    iterparse_xml,
+    parse_nodes,
+    read_xml_file,
+    read_xml_root,
+)
 
 
 def test_get_ns_map(settings):
@@ -29,3 +38,20 @@ def test_flat_xml_to_elements(settings):
     root = read_xml_file(xml_path)
     elements = flat_xml_to_elements(root)
     assert elements['http://example.com/terms/domain/blocks']['uri'] == 'http://example.com/terms/domain/blocks'
+
+
+def test_iterparse_xml(settings):
+    xml_path = Path(settings.BASE_DIR) / 'xml/elements/catalogs.xml'
+    ns_map = {}
+    nodes = iterparse_xml(xml_path, ns_map)
+    root, error = read_xml_root(nodes)
+    assert error is None
+    assert root.tag == 'rdmo'
+    assert ns_map == {'dc': 'http://purl.org/dc/elements/1.1/'}
+
+    elements, error = parse_nodes(nodes, ns_map)
+    assert error is None
+    assert elements == flat_xml_to_elements(read_xml_file(xml_path))
+
+    # the parsed elements are released from the root
+    assert len(root) == 0
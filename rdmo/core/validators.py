@@ -1,10 +1,13 @@
 import re
 
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
+from django.db.models import IntegerField, Value
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+from .managers import LockedManagerMixin
+
 
 class InstanceValidator:
 
@@ -42,6 +45,13 @@ class UniqueURIValidator(InstanceValidator):
 
     path_pattern = re.compile(r'^[\w\-\/]+\Z')
 
+    # maximum number of uris per query in fetch_uris
+    batch_size = 500
+
+    def __init__(self, instance=None, uris=None):
+        super().__init__(instance)
+        self.uris = uris
+
     def __call__(self, data, serializer=None):
         super().__call__(data, serializer)
 
@@ -50,26 +60,51 @@ class UniqueURIValidator(InstanceValidator):
     def validate(self, model, instance, uri):
         models = self.models or [model]
 
+        # use the uris which were fetched in bulk (e.g. for the import),
+        # and fetch the remaining models using one query
+        uris = self.uris or {}
+        missing_models = [model for model in models if uri not in uris.get(model, {})]
+        if missing_models:
+            uris = {**uris, **self.fetch_uris(missing_models, [uri])}
+
         for model in models:
-            try:
-                if instance:
-                    model.objects.exclude(pk=instance.id).get(uri=uri)
-                else:
-                    model.objects.get(uri=uri)
-            except MultipleObjectsReturned:
-                pass
-            except ObjectDoesNotExist:
-                continue
-
-            message = _('%(model)s with the uri "%(uri)s" already exists.') % {
-                'model': model._meta.verbose_name.title(),
-                'uri': uri
-            }
+            pks = uris[model][uri]
+            if instance is not None and isinstance(instance, model):
+                pks = pks - {instance.id}
+
+            if pks:
+                message = _('%(model)s with the uri "%(uri)s" already exists.') % {
+                    'model': model._meta.verbose_name.title(),
+                    'uri': uri
+                }
+
+                self.raise_validation_error({
+                    'uri_path': message,
+                    'key': message
+                })
 
-            self.raise_validation_error({
-                'uri_path': message,
-                'key': message
-            })
+    @classmethod
+    def fetch_uris(cls, models, uris):
+        """
+        Returns the primary keys of the elements with the given uris as {model: {uri: {pk, ...}}}
+        for all models, using one query (per batch of uris) across all models.
+        """
+        uris = list(dict.fromkeys(uris))
+        fetched_uris = {model: {uri: set() for uri in uris} for model in models}
+
+        for index in range(0, len(uris), cls.batch_size):
+            batch = uris[index:index + cls.batch_size]
+            querysets = [
+                model.objects.filter(uri__in=batch)
+                             .order_by()
+                             .annotate(model_index=Value(model_index, output_field=IntegerField()))
+                             .values_list('model_index', 'pk', 'uri')
+                for model_index, model in enumerate(models)
+            ]
+            for model_index, pk, uri in querysets[0].union(*querysets[1:], all=True):
+                fetched_uris[models[model_index]][uri].add(pk)
+
+        return fetched_uris
 
     def get_uri(self, data):
         uri_prefix = data.get('uri_prefix')
@@ -114,6 +149,11 @@ class LockedValidator(InstanceValidator):
             for parent_field in self.parent_fields:
                 parent = getattr(self.instance, parent_field)
 
+                if isinstance(parent, LockedManagerMixin):
+                    # check all parents at once, using the locked filter of the related manager
+                    is_locked |= parent.filter_locked().exists()
+                    continue
+
                 try:
                     is_locked |= parent.is_locked
                 except AttributeError:
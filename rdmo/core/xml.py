@@ -1,12 +1,14 @@
 import logging
 import re
 from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 from xml.etree.ElementTree import Element as xmlElement
 
 from django.utils.translation import gettext_lazy as _
 
 import defusedxml.ElementTree as ET
+from defusedxml import DefusedXmlException
 from packaging.version import Version, parse
 
 from rdmo import __version__
@@ -35,6 +37,42 @@ def read_xml(file: Path) -> tuple[xmlElement | None, str | None]:
         return None, _('XML Parsing Error') + f': {e!s}'
 
 
+def iterparse_xml(file: Path, ns_map: dict) -> Iterator[xmlElement]:
+    """
+    Parses the xml file incrementally and yields the root node first, followed by each of its
+    child elements once it was read completely. The ns_map is filled from the start-ns events.
+    The child elements are removed from the root after they were yielded, so that only the
+    current element is kept in memory.
+    """
+    root = None
+    depth = 0
+    for event, node in ET.iterparse(file, events=('start-ns', 'start', 'end')):
+        if event == 'start-ns':
+            prefix, uri = node
+            if prefix:
+                ns_map[prefix] = uri
+        elif event == 'start':
+            if root is None:
+                root = node
+                yield root
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                yield node
+                root.remove(node)
+
+
+def read_xml_root(nodes: Iterator[xmlElement]) -> tuple[xmlElement | None, str | None]:
+    # step 2: start to parse the xml and get the root
+    try:
+        return next(nodes), None
+    except StopIteration:
+        return None, None
+    except Exception as e:
+        return None, _('XML Parsing Error') + f': {e!s}'
+
+
 def validate_root(root: xmlElement | None) -> tuple[bool, str | None]:
     if root is None:
         return False, _('The content of the XML file does not consist of well-formed data or markup.')
@@ -92,11 +130,17 @@ def validate_legacy_elements(elements: dict, root_version: Version) -> list[str]
         return errors
 
 
-def parse_elements(root: xmlElement) -> tuple[dict, str | None]:
-    # step 3: create element dicts from xml
+def parse_nodes(nodes: Iterator[xmlElement], ns_map: dict) -> tuple[dict, str | None]:
+    # step 3: create element dicts from the xml nodes, while they are parsed
+    elements = {}
     try:
-        elements = flat_xml_to_elements(root)
+        for node in nodes:
+            uri, element = xml_node_to_element(node, ns_map)
+            elements[uri] = element
         return elements, None
+    except (ET.ParseError, DefusedXmlException) as e:
+        logger.info('Import failed with %s (%s)', type(e).__name__, e)
+        return {}, _('XML Parsing Error') + f': {e!s}'
     except (KeyError, TypeError, AttributeError) as e:
         logger.info('Import failed with %s (%s)', type(e).__name__, e)
         return {}, _('This is not a valid RDMO XML file.')
@@ -112,7 +156,11 @@ def parse_xml_to_elements(xml_file=None) -> tuple[OrderedDict, list]:
         errors.append(file_error)
         return OrderedDict(), errors
 
-    root, read_error = read_xml(file)
+    # the xml is parsed incrementally, the namespaces are collected while parsing
+    ns_map = {}
+    nodes = iterparse_xml(file, ns_map)
+
+    root, read_error = read_xml_root(nodes)
 
     if read_error:
         logger.error(read_error)
@@ -125,18 +173,18 @@ def parse_xml_to_elements(xml_file=None) -> tuple[OrderedDict, list]:
         errors.insert(0, root_validation_error)
         return OrderedDict(), errors
 
-    # step 3: create element dicts from xml
-    elements, parsing_error = parse_elements(root)
-    if parsing_error is not None:
-        errors.append(parsing_error)
-        return OrderedDict(), errors
-
-    # step 3.1: validate version
+    # step 2.2: validate version, the attributes of the root are available before the elements are parsed
     root_version, version_errors = validate_and_get_xml_version_from_root(root)
     if version_errors:
         errors.extend(version_errors)
         return OrderedDict(), errors
 
+    # step 3: create element dicts from xml
+    elements, parsing_error = parse_nodes(nodes, ns_map)
+    if parsing_error is not None:
+        errors.append(parsing_error)
+        return OrderedDict(), errors
+
     # step 3.1.1: validate the legacy elements
     legacy_errors = validate_legacy_elements(elements, root_version)
     if legacy_errors:
@@ -173,50 +221,55 @@ def parse_xml_string(string):
 def flat_xml_to_elements(root) -> dict:
     elements = {}
     ns_map = get_ns_map(root)
-    uri_attrib = get_ns_tag('dc:uri', ns_map)
 
     for node in root:
-        uri = get_uri(node, ns_map)
+        uri, element = xml_node_to_element(node, ns_map)
+        elements[uri] = element
 
-        element = {
-            'uri': get_uri(node, ns_map),
-            'model': RDMO_MODELS[node.tag]
-        }
+    return elements
 
-        for sub_node in node:
-            tag = strip_ns(sub_node.tag, ns_map)
 
-            if uri_attrib in sub_node.attrib:
-                # this node has an uri!
-                element[tag] = {
-                    'uri': sub_node.attrib[uri_attrib]
+def xml_node_to_element(node, ns_map) -> tuple[str, dict]:
+    uri_attrib = get_ns_tag('dc:uri', ns_map)
+    uri = get_uri(node, ns_map)
+
+    element = {
+        'uri': uri,
+        'model': RDMO_MODELS[node.tag]
+    }
+
+    for sub_node in node:
+        tag = strip_ns(sub_node.tag, ns_map)
+
+        if uri_attrib in sub_node.attrib:
+            # this node has an uri!
+            element[tag] = {
+                'uri': sub_node.attrib[uri_attrib]
+            }
+            if sub_node.tag in RDMO_MODELS:
+                element[tag]['model'] = RDMO_MODELS[sub_node.tag]
+        elif 'lang' in sub_node.attrib:
+            # this node has the lang attribute!
+            element['{}_{}'.format(tag, sub_node.attrib['lang'])] = sub_node.text
+        elif list(sub_node):
+            # this node is a list!
+            element[tag] = []
+            for sub_sub_node in sub_node:
+                sub_element = {
+                    'uri': sub_sub_node.attrib[uri_attrib]
                 }
-                if sub_node.tag in RDMO_MODELS:
-                    element[tag]['model'] = RDMO_MODELS[sub_node.tag]
-            elif 'lang' in sub_node.attrib:
-                # this node has the lang attribute!
-                element['{}_{}'.format(tag, sub_node.attrib['lang'])] = sub_node.text
-            elif list(sub_node):
-                # this node is a list!
-                element[tag] = []
-                for sub_sub_node in sub_node:
-                    sub_element = {
-                        'uri': sub_sub_node.attrib[uri_attrib]
-                    }
-                    if sub_sub_node.tag in RDMO_MODELS:
-                        sub_element['model'] = RDMO_MODELS[sub_sub_node.tag]
-                    if 'order' in sub_sub_node.attrib:
-                        sub_element['order'] = sub_sub_node.attrib['order']
-
-                    element[tag].append(sub_element)
-            elif sub_node.text is None or not sub_node.text.strip():
-                element[tag] = None
-            else:
-                element[tag] = sub_node.text
-
-        elements[uri] = element
-
-    return elements
+                if sub_sub_node.tag in RDMO_MODELS:
+                    sub_element['model'] = RDMO_MODELS[sub_sub_node.tag]
+                if 'order' in sub_sub_node.attrib:
+                    sub_element['order'] = sub_sub_node.attrib['order']
+
+                element[tag].append(sub_element)
+        elif sub_node.text is None or not sub_node.text.strip():
+            element[tag] = None
+        else:
+            element[tag] = sub_node.text
+
+    return uri, element
 
 
 def get_ns_tag(tag, ns_map):
@@ -0,0 +1,23 @@
+from django.db import models
+
+from mptt.models import TreeManager
+from mptt.querysets import TreeQuerySet
+
+from rdmo.core.managers import LockedManagerMixin, LockedQuerySetMixin
+
+
+class AttributeQuerySet(LockedQuerySetMixin, TreeQuerySet):
+
+    def get_locked_filter(self):
+        # an attribute is locked if it or one of its ancestors, i.e. an attribute
+        # of the same tree whose (lft, rght) range includes the attribute, is locked
+        return models.Q(models.Exists(self.model.objects.filter(
+            tree_id=models.OuterRef('tree_id'),
+            lft__lte=models.OuterRef('lft'),
+            rght__gte=models.OuterRef('rght'),
+            locked=True
+        )))
+
+
+class AttributeManager(LockedManagerMixin, TreeManager.from_queryset(AttributeQuerySet)):
+    pass
@@ -1,12 +1,16 @@
 from django.conf import settings
 from django.contrib.sites.models import Site
-from django.db import models
+from django.db import models, transaction
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from mptt.models import MPTTModel, TreeForeignKey
 
 from rdmo.core.utils import join_url
 
+from .managers import AttributeManager
+from .signals import attribute_descendants_updated
+
 
 class Attribute(MPTTModel):
 
@@ -52,6 +56,8 @@ class Attribute(MPTTModel):
         help_text=_('Parent attribute in the domain model.')
     )
 
+    objects = AttributeManager()
+
     class Meta:
         ordering = ('uri', )
         verbose_name = _('Attribute')
@@ -63,13 +69,32 @@ class Attribute(MPTTModel):
     def save(self, *args, **kwargs):
         self.path = self.build_path(self.key, self.parent)
         self.uri = self.build_uri(self.uri_prefix, self.path)
-        super().save(*args, **kwargs)
 
-        # recursively save children
-        for child in self.children.all():
-            child.save()
+        # a new attribute has no descendants yet (and copied instances still have the tree fields of the original)
+        adding = self._state.adding
 
-    @property
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not adding:
+                self.store_descendants_paths()
+
+    def store_descendants_paths(self):
+        # the descendants are fetched in tree order, so that the path of the parent is always computed first
+        paths = {self.id: self.path}
+        descendants = []
+        for descendant in self.get_descendants().only('id', 'parent_id', 'key', 'uri_prefix', 'path', 'uri'):
+            path = paths[descendant.id] = f'{paths[descendant.parent_id]}/{descendant.key}'
+            uri = self.build_uri(descendant.uri_prefix, path)
+            if (descendant.path, descendant.uri) != (path, uri):
+                descendant.path = path
+                descendant.uri = uri
+                descendants.append(descendant)
+
+        if descendants:
+            Attribute.objects.bulk_update(descendants, ('path', 'uri'), batch_size=1000)
+            attribute_descendants_updated.send(sender=Attribute, instance=self, descendants=descendants)
+
+    @cached_property
     def is_locked(self) -> bool:
         return self.get_ancestors(include_self=True).filter(locked=True).exists()
 
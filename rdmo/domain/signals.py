@@ -0,0 +1,3 @@
+from django.dispatch import Signal
+
+attribute_descendants_updated = Signal()
@@ -1,4 +1,7 @@
+import pytest
+
 from ..models import Attribute
+from ..signals import attribute_descendants_updated
 
 
 def test_attribute_str(db):
@@ -11,3 +14,62 @@ def test_attribute_clean(db):
     instances = Attribute.objects.all()
     for instance in instances:
         instance.clean()
+
+
+def test_attribute_annotate_is_locked(db):
+    attribute = Attribute.objects.exclude(children=None).exclude(parent=None).first()
+    attribute.locked = True
+    attribute.save()
+
+    descendant_ids = set(attribute.get_descendants(include_self=True).values_list('id', flat=True))
+    for instance in Attribute.objects.annotate_is_locked():
+        assert instance.is_locked == Attribute.objects.get(id=instance.id).is_locked
+        assert instance.is_locked == (instance.id in descendant_ids or instance.locked)
+
+
+def test_attribute_save_descendants(db, mocker):
+    receiver = mocker.Mock()
+    attribute_descendants_updated.connect(receiver, sender=Attribute)
+
+    attribute = max(Attribute.objects.filter(parent=None), key=lambda attribute: attribute.get_descendant_count())
+    descendants_count = attribute.get_descendant_count()
+    assert descendants_count > 0
+
+    attribute.key = 'renamed'
+    attribute.save()
+
+    for descendant in attribute.get_descendants():
+        assert descendant.path.startswith('renamed/')
+        assert descendant.path == Attribute.build_path(descendant.key, descendant.parent)
+        assert descendant.uri == Attribute.build_uri(descendant.uri_prefix, descendant.path)
+
+    # the dependents are notified once, for all descendants
+    receiver.assert_called_once()
+    assert len(receiver.call_args.kwargs['descendants']) == descendants_count
+
+    attribute_descendants_updated.disconnect(receiver, sender=Attribute)
+
+
+def test_attribute_save_descendants_move(db):
+    attribute = Attribute.objects.exclude(children=None).exclude(parent=None).first()
+    parent = Attribute.objects.exclude(id__in=attribute.get_descendants(include_self=True)) \
+                              .exclude(id=attribute.parent_id).first()
+
+    attribute.parent = parent
+    attribute.save()
+
+    assert attribute.path == f'{parent.path}/{attribute.key}'
+    for descendant in attribute.get_descendants():
+        assert descendant.path.startswith(f'{attribute.path}/')
+        assert descendant.path == Attribute.build_path(descendant.key, descendant.parent)
+
+
+@pytest.mark.performance
+def test_attribute_save_descendants_queries(db, django_assert_max_num_queries):
+    attribute = max(Attribute.objects.filter(parent=None), key=lambda attribute: attribute.get_descendant_count())
+    assert attribute.get_descendant_count() > 10
+
+    # the descendants are fetched once and updated in one batch, instead of saving each of them
+    attribute.key = 'renamed'
+    with django_assert_max_num_queries(10):
+        attribute.save()
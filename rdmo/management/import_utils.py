@@ -1,6 +1,7 @@
 import logging
 from collections import defaultdict
 from dataclasses import asdict
+from functools import cache
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model
@@ -92,37 +93,49 @@ def apply_field_values(instance, element, import_helper, original) -> None:
                         extra_field_helper=extra_field)
 
 
-def validate_with_serializer_field(instance, field_name, value):
-    """Validate and convert a value using the corresponding DRF serializer field."""
+@cache
+def get_serializer_field(model, field_name):
+    """
+    Build the DRF serializer field for a model field. The field only depends on
+    the model and the field name and is therefore cached for the lifetime of the process.
+    """
 
     # Ensure the field exists on the model
     try:
-        model_field = instance._meta.get_field(field_name)
+        model_field = model._meta.get_field(field_name)
     except FieldDoesNotExist:
         logger.debug("Field '%s' does not exist on the model.", field_name)
         return None
 
     # Use ModelSerializer's field building logic
-    serializer = ModelSerializer(instance=instance)
+    serializer = ModelSerializer()
     try:
         field_class, field_kwargs = serializer.build_standard_field(field_name, model_field)
     except (KeyError, AttributeError):
         logger.info("Could not build a field for '%s'.", field_name)
         return None
 
+    return field_class(**field_kwargs)
+
+
+def validate_with_serializer_field(instance, field_name, value):
+    """Validate and convert a value using the corresponding DRF serializer field."""
+
+    drf_field = get_serializer_field(instance._meta.model, field_name)
+    if drf_field is None:
+        return None
+
     # Handle None values and null fields
-    if value is None and field_kwargs.get('allow_null', False):
+    if value is None and drf_field.allow_null:
         return value  # None is allowed, no need to validate further
 
     try:
-        # Instantiate the field with the kwargs and run validation
-        drf_field = field_class(**field_kwargs)
         return drf_field.run_validation(value)
     except ValidationError as e:
         # Log only if the value is truly invalid
         if value is not None:
             logger.info("Cannot convert '%s' for field '%s' using '%s': %s",
-                         value, field_name, field_class.__name__, str(e))
+                         value, field_name, type(drf_field).__name__, str(e))
     return None
 
 
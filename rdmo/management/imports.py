@@ -1,6 +1,6 @@
-import copy
 import logging
 from collections import OrderedDict
+from collections.abc import Callable
 
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
@@ -10,10 +10,12 @@ from rdmo.conditions.imports import import_helper_condition
 from rdmo.core.imports import (
     ImportElementFields,
     check_permissions,
+    fetch_original_values,
     get_or_return_instance,
     make_import_info_msg,
     validate_instance,
 )
+from rdmo.core.validators import UniqueURIValidator
 from rdmo.core.xml import order_elements
 from rdmo.domain.imports import import_helper_attribute
 from rdmo.management.import_utils import (
@@ -56,31 +58,42 @@ ELEMENT_IMPORT_HELPERS = {
 
 def import_elements(uploaded_elements: OrderedDict,
                     save: bool = True,
-                    request: HttpRequest | None = None) -> list[dict]:
+                    request: HttpRequest | None = None,
+                    user=None,
+                    current_site=None,
+                    progress: Callable | None = None) -> list[dict]:
     imported_elements = []
     uploaded_elements_initial_ordering = {uri: n for n, uri in enumerate(uploaded_elements.keys())}
     uploaded_uris = set(uploaded_elements.keys())
-    current_site = get_current_site(request)
+    if current_site is None:
+        current_site = get_current_site(request)
     if save:
         # when saving, the elements are ordered according to the rdmo models
         pass
         uploaded_elements = order_elements(uploaded_elements)
 
-    for _uri, uploaded_element in uploaded_elements.items():
-        if not is_valid_import_element(uploaded_element):
-            continue
-        element = import_element(
-            element=uploaded_element,
-            save=save,
-            request=request,
-            current_site=current_site
-        )
-        element[ImportElementFields.WARNINGS] = {
-            k: val for
-            k, val in element[ImportElementFields.WARNINGS].items()
-            if k not in uploaded_uris
-        }
-        imported_elements.append(element)
+    # fetch the existing uris for all uploaded elements at once, to be used by the UniqueURIValidator
+    uris = fetch_uploaded_uris(uploaded_uris)
+
+    for processed, uploaded_element in enumerate(uploaded_elements.values(), start=1):
+        if is_valid_import_element(uploaded_element):
+            element = import_element(
+                element=uploaded_element,
+                save=save,
+                request=request,
+                user=user,
+                current_site=current_site,
+                uris=uris
+            )
+            element[ImportElementFields.WARNINGS] = {
+                k: val for
+                k, val in element[ImportElementFields.WARNINGS].items()
+                if k not in uploaded_uris
+            }
+            imported_elements.append(element)
+
+        if progress is not None:
+            progress(processed)
 
     # sort elements back to initial order of uploaded elements
     imported_elements = sorted(
@@ -92,11 +105,36 @@ def import_elements(uploaded_elements: OrderedDict,
     return imported_elements
 
 
+def fetch_uploaded_uris(uploaded_uris: set) -> dict:
+    # attributes are not included, since saving an attribute changes the uris of its descendants
+    models = list(dict.fromkeys(
+        model
+        for element_model, import_helper in ELEMENT_IMPORT_HELPERS.items()
+        if element_model != 'domain.attribute'
+        for validator in import_helper.validators
+        if issubclass(validator, UniqueURIValidator)
+        for model in (validator.models or [validator.model])
+    ))
+    return UniqueURIValidator.fetch_uris(models, uploaded_uris)
+
+
+def update_uploaded_uris(uris: dict, uri: str, instance) -> None:
+    # keep the fetched uris up to date, when an element was saved
+    model_uris = uris.get(type(instance))
+    if model_uris is not None:
+        if uri in model_uris:
+            model_uris[uri].discard(instance.id)
+        if instance.uri in model_uris:
+            model_uris[instance.uri].add(instance.id)
+
+
 def import_element(
         element: dict | None = None,
         save: bool = True,
         request: HttpRequest | None = None,
-        current_site = None
+        user=None,
+        current_site = None,
+        uris: dict | None = None
     ) -> dict:
 
     initialize_import_element_dict(element)
@@ -110,16 +148,17 @@ def import_element(
     # get or create instance from uri and model
     instance, created = get_or_return_instance(import_helper.model, uri=uri)
 
-    # keep a copy of the original
+    # keep a snapshot of the original field values
     # when the element is updated
     # needs to be created here, else the changes will be overwritten
-    original = copy.deepcopy(instance) if not created else None
+    original = fetch_original_values(instance, element, import_helper) if not created else None
 
     # prepare a log message
     msg = make_import_info_msg(import_helper.model._meta.verbose_name, created, uri=uri)
 
     # check the change or add permissions for the user on the instance
-    user = request.user if request is not None else None
+    if request is not None:
+        user = request.user
     perms_error_msg = check_permissions(instance, uri, user)
     if perms_error_msg:
         # when there is an error msg, the import can be stopped and return
@@ -135,7 +174,7 @@ def import_element(
     apply_field_values(instance, element, import_helper, original)
 
     # call the validators on the instance
-    validate_instance(instance, element, *import_helper.validators)
+    validate_instance(instance, element, *import_helper.validators, uris=uris)
 
     update_extra_fields_from_validated_instance(instance, element, import_helper, original=original)
 
@@ -150,6 +189,9 @@ def import_element(
         logger.info(msg)
         instance.save()
 
+        if uris is not None:
+            update_uploaded_uris(uris, uri, instance)
+
         update_related_fields(instance, element, import_helper, original, save)
 
         if created and settings.MULTISITE:
@@ -0,0 +1,92 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from rdmo.core.xml import parse_xml_to_elements
+
+from .imports import import_elements
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def get_executor():
+    # the worker processes are spawned (not forked), so that they open their own database connections
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.MANAGEMENT_IMPORT_JOBS_PROCESSES,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=setup_worker
+        )
+    return _executor
+
+
+def setup_worker():
+    import django
+    django.setup()
+
+
+def start_import_job(job):
+    # the job is started when the transaction which created it was committed,
+    # for the 'command' worker the job is processed by the run_import_jobs management command
+    if settings.MANAGEMENT_IMPORT_JOBS_WORKER == 'process':
+        transaction.on_commit(lambda: get_executor().submit(run_import_job, job.id))
+
+
+def run_import_job(job_id):
+    # claim the job, so that it is not processed twice
+    if not ImportJob.objects.filter(id=job_id, status=ImportJob.STATUS_PENDING) \
+                            .update(status=ImportJob.STATUS_RUNNING, updated=now()):
+        return
+
+    job = ImportJob.objects.select_related('user', 'site').get(id=job_id)
+
+    try:
+        if job.file_name:
+            elements, errors = parse_xml_to_elements(xml_file=job.file_name)
+        else:
+            elements, errors = {element['uri']: element for element in job.elements if 'uri' in element}, []
+
+        if errors:
+            logger.info('Import job %s failed with XML validation errors.', job.id)
+            job.status = ImportJob.STATUS_FAILURE
+            job.errors = [str(error) for error in errors]
+        else:
+            ImportJob.objects.filter(id=job.id).update(total=len(elements), updated=now())
+
+            job.result = import_elements(elements, save=job.save_elements, user=job.user, current_site=job.site,
+                                         progress=lambda processed: update_import_job_progress(job.id, processed))
+            job.status = ImportJob.STATUS_SUCCESS
+    except Exception as e:
+        logger.exception('Import job %s failed.', job.id)
+        job.status = ImportJob.STATUS_FAILURE
+        job.errors = [str(e)]
+
+    job.refresh_from_db(fields=('total', 'processed'))
+    job.save()
+
+    # the temporary file is not needed anymore, once the job has finished
+    if job.file_name:
+        Path(job.file_name).unlink(missing_ok=True)
+
+
+def update_import_job_progress(job_id, processed):
+    # the updated field is used as heartbeat, see requeue_stale_import_jobs
+    ImportJob.objects.filter(id=job_id).update(processed=processed, updated=now())
+
+
+def requeue_stale_import_jobs():
+    # jobs which are still running, but did not report progress for MANAGEMENT_IMPORT_JOBS_TIMEOUT
+    # seconds (e.g. because the worker was killed) are set to pending, so that they are processed again
+    stale = now() - timedelta(seconds=settings.MANAGEMENT_IMPORT_JOBS_TIMEOUT)
+    return ImportJob.objects.filter(status=ImportJob.STATUS_RUNNING, updated__lt=stale) \
+                            .update(status=ImportJob.STATUS_PENDING, processed=0, updated=now())
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from rdmo.management.jobs import requeue_stale_import_jobs, run_import_job
+from rdmo.management.models import ImportJob
+
+
+class Command(BaseCommand):
+    help = 'Process the pending import jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wait', action='store_true', help='Keep running and wait for new import jobs.')
+        parser.add_argument('--interval', type=int, default=5, help='Seconds to wait between checks for new jobs.')
+
+    def handle(self, *args, **options):
+        while True:
+            count = requeue_stale_import_jobs()
+            if count:
+                self.stdout.write(f'Queued {count} stale import jobs again.')
+
+            job_ids = ImportJob.objects.filter(status=ImportJob.STATUS_PENDING) \
+                                       .order_by('created') \
+                                       .values_list('id', flat=True)
+
+            for job_id in job_ids:
+                run_import_job(job_id)
+
+                job = ImportJob.objects.get(id=job_id)
+                self.stdout.write(f'Import job {job.id}: {job.status} ({job.processed}/{job.total})')
+
+            if not options['wait']:
+                break
+
+            time.sleep(options['interval'])
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:38
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(editable=False, verbose_name='created')),
+                ('updated', models.DateTimeField(editable=False, verbose_name='updated')),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('success', 'success'), ('failure', 'failure')], default='pending', help_text='The status of this import job.', max_length=8, verbose_name='Status')),
+                ('save_elements', models.BooleanField(default=True, help_text='Designates whether the elements are saved or only compared to the existing elements.', verbose_name='Save elements')),
+                ('file_name', models.CharField(blank=True, help_text='The temporary file for this import job.', max_length=256, verbose_name='File name')),
+                ('elements', models.JSONField(blank=True, help_text='The elements for this import job, if no file was uploaded.', null=True, verbose_name='Elements')),
+                ('total', models.IntegerField(default=0, help_text='The number of elements for this import job.', verbose_name='Total')),
+                ('processed', models.IntegerField(default=0, help_text='The number of elements which were already processed.', verbose_name='Processed')),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The imported elements including the changes and warnings.', null=True, verbose_name='Result')),
+                ('errors', models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The errors which prevented the import.', verbose_name='Errors')),
+                ('site', models.ForeignKey(help_text='The site for this import job.', null=True, on_delete=django.db.models.deletion.SET_NULL, to='sites.site', verbose_name='Site')),
+                ('user', models.ForeignKey(help_text='The user who started this import job.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='import_jobs', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Import job',
+                'verbose_name_plural': 'Import jobs',
+                'ordering': ('-created',),
+            },
+        ),
+    ]
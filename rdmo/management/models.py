@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from rdmo.core.models import Model
+
+
+class ImportJob(Model):
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCESS = 'success'
+    STATUS_FAILURE = 'failure'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _('pending')),
+        (STATUS_RUNNING, _('running')),
+        (STATUS_SUCCESS, _('success')),
+        (STATUS_FAILURE, _('failure')),
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='import_jobs',
+        verbose_name=_('User'),
+        help_text=_('The user who started this import job.')
+    )
+    site = models.ForeignKey(
+        Site, on_delete=models.SET_NULL, null=True,
+        verbose_name=_('Site'),
+        help_text=_('The site for this import job.')
+    )
+    status = models.CharField(
+        max_length=8, choices=STATUS_CHOICES, default=STATUS_PENDING,
+        verbose_name=_('Status'),
+        help_text=_('The status of this import job.')
+    )
+    save_elements = models.BooleanField(
+        default=True,
+        verbose_name=_('Save elements'),
+        help_text=_('Designates whether the elements are saved or only compared to the existing elements.')
+    )
+    file_name = models.CharField(
+        max_length=256, blank=True,
+        verbose_name=_('File name'),
+        help_text=_('The temporary file for this import job.')
+    )
+    elements = models.JSONField(
+        null=True, blank=True,
+        verbose_name=_('Elements'),
+        help_text=_('The elements for this import job, if no file was uploaded.')
+    )
+    total = models.IntegerField(
+        default=0,
+        verbose_name=_('Total'),
+        help_text=_('The number of elements for this import job.')
+    )
+    processed = models.IntegerField(
+        default=0,
+        verbose_name=_('Processed'),
+        help_text=_('The number of elements which were already processed.')
+    )
+    result = models.JSONField(
+        null=True, blank=True, encoder=DjangoJSONEncoder,
+        verbose_name=_('Result'),
+        help_text=_('The imported elements including the changes and warnings.')
+    )
+    errors = models.JSONField(
+        default=list, blank=True, encoder=DjangoJSONEncoder,
+        verbose_name=_('Errors'),
+        help_text=_('The errors which prevented the import.')
+    )
+
+    class Meta:
+        ordering = ('-created', )
+        verbose_name = _('Import job')
+        verbose_name_plural = _('Import jobs')
+
+    def __str__(self):
+        return f'{self.user} / {self.created}'
@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from ..models import ImportJob
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = ImportJob
+        fields = (
+            'id',
+            'status',
+            'save_elements',
+            'total',
+            'processed',
+            'errors',
+            'created',
+            'updated',
+        )
+
+
+class ImportJobDetailSerializer(ImportJobSerializer):
+
+    class Meta(ImportJobSerializer.Meta):
+        fields = (
+            *ImportJobSerializer.Meta.fields,
+            'result',
+        )
@@ -1,8 +1,12 @@
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
+from rest_framework.serializers import ModelSerializer
+
 from rdmo.core.imports import ImportElementFields
+from rdmo.management.import_utils import get_serializer_field
 from rdmo.management.imports import import_elements
 from rdmo.options.models import Option, OptionSet
 
@@ -246,3 +250,43 @@ def test_update_legacy_options(db, settings, delete_all_objects):
     assert Option.objects.count() == 8
     assert all(element[ImportElementFields.CREATED] is False for element in imported_elements)
     assert all(element[ImportElementFields.UPDATED] is True for element in imported_elements)
+
+
+@pytest.mark.performance
+def test_create_large_optionset_serializer_fields(db, mocker):
+    get_serializer_field.cache_clear()
+    build_standard_field = mocker.spy(ModelSerializer, 'build_standard_field')
+
+    uri_prefix = 'http://example.com/terms'
+    optionset_uri = f'{uri_prefix}/options/large'
+    option_uris = [f'{optionset_uri}/{n}' for n in range(500)]
+
+    elements = OrderedDict()
+    for order, option_uri in enumerate(option_uris):
+        elements[option_uri] = {
+            'uri': option_uri,
+            'model': 'options.option',
+            'uri_prefix': uri_prefix,
+            'uri_path': option_uri.replace(f'{uri_prefix}/options/', ''),
+            'text_en': f'Option {order}',
+            'additional_input': '',
+        }
+    elements[optionset_uri] = {
+        'uri': optionset_uri,
+        'model': 'options.optionset',
+        'uri_prefix': uri_prefix,
+        'uri_path': 'large',
+        'order': '1',
+        'options': [
+            {'uri': option_uri, 'model': 'options.option', 'order': str(order)}
+            for order, option_uri in enumerate(option_uris)
+        ],
+    }
+
+    imported_elements = import_elements(elements)
+
+    assert not any(element[ImportElementFields.ERRORS] for element in imported_elements)
+    assert OptionSet.objects.get(uri=optionset_uri).options.count() == 500
+
+    # the serializer fields are only built once per model and extra field
+    assert build_standard_field.call_count == 3  # option.additional_input, optionset.order, optionset.provider_key
@@ -0,0 +1,149 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.timezone import now
+
+from rdmo.questions.models import Catalog
+
+from ..jobs import run_import_job
+from ..models import ImportJob
+
+users = (
+    ('editor', 'editor'),
+    ('reviewer', 'reviewer'),
+    ('user', 'user'),
+    ('api', 'api'),
+    ('anonymous', None),
+)
+
+status_map = {
+    'create': {
+        'editor': 202, 'reviewer': 403, 'api': 202, 'user': 403, 'anonymous': 401
+    }
+}
+
+urlnames = {
+    'upload': 'v1-management:upload-list',
+    'import': 'v1-management:import-list',
+    'list': 'v1-management:job-list',
+    'detail': 'v1-management:job-detail'
+}
+
+
+@pytest.fixture(autouse=True)
+def import_jobs_worker(settings):
+    settings.MANAGEMENT_IMPORT_JOBS_WORKER = 'command'
+
+
+@pytest.mark.parametrize('username,password', users)
+def test_upload_job(db, client, username, password):
+    client.login(username=username, password=password)
+
+    xml_file = Path(settings.BASE_DIR) / 'xml' / 'elements' / 'catalogs.xml'
+
+    with open(xml_file, encoding='utf8') as f:
+        response = client.post(reverse(urlnames['upload']), {'file': f, 'job': 'true'})
+
+    assert response.status_code == status_map['create'][username], response.json()
+    if response.status_code == 202:
+        job_id = response.json()['id']
+        assert response.json()['status'] == ImportJob.STATUS_PENDING
+
+        run_import_job(job_id)
+
+        response = client.get(reverse(urlnames['detail'], args=[job_id]))
+        assert response.status_code == 200
+        job = response.json()
+        assert job['status'] == ImportJob.STATUS_SUCCESS
+        assert not Path(ImportJob.objects.get(id=job_id).file_name).exists()
+        assert job['total'] == job['processed'] > 0
+        assert len(job['result']) == job['total']
+        for element in job['result']:
+            assert element['updated'] is True
+
+        # the job is not processed again
+        run_import_job(job_id)
+        assert ImportJob.objects.get(id=job_id).status == ImportJob.STATUS_SUCCESS
+
+
+def test_upload_job_error(db, client):
+    client.login(username='editor', password='editor')
+
+    xml_file = Path(settings.BASE_DIR) / 'xml' / 'error.xml'
+
+    with open(xml_file, encoding='utf8') as f:
+        response = client.post(reverse(urlnames['upload']), {'file': f, 'job': 'true'})
+    assert response.status_code == 202
+
+    call_command('run_import_jobs')
+
+    job = ImportJob.objects.get(id=response.json()['id'])
+    assert job.status == ImportJob.STATUS_FAILURE
+    assert job.errors
+
+
+def test_import_job(db, client, json_data):
+    client.login(username='editor', password='editor')
+
+    response = client.post(reverse(urlnames['import']), {**json_data, 'job': True}, content_type='application/json')
+    assert response.status_code == 202
+
+    call_command('run_import_jobs')
+
+    job = ImportJob.objects.get(id=response.json()['id'])
+    assert job.status == ImportJob.STATUS_SUCCESS
+    assert job.processed == job.total == len(json_data['elements'])
+    assert Catalog.objects.filter(uri__in=[element['uri'] for element in job.result]).exists()
+
+
+def test_import_job_stale(db, client, json_data):
+    client.login(username='editor', password='editor')
+
+    response = client.post(reverse(urlnames['import']), {**json_data, 'job': True}, content_type='application/json')
+    assert response.status_code == 202
+
+    # a job, which is running, but did not report progress for too long, is processed again
+    job_id = response.json()['id']
+    updated = now() - timedelta(seconds=settings.MANAGEMENT_IMPORT_JOBS_TIMEOUT + 1)
+    ImportJob.objects.filter(id=job_id).update(status=ImportJob.STATUS_RUNNING, processed=1, updated=updated)
+
+    call_command('run_import_jobs')
+
+    job = ImportJob.objects.get(id=job_id)
+    assert job.status == ImportJob.STATUS_SUCCESS
+    assert job.processed == job.total == len(json_data['elements'])
+
+
+def test_import_job_running(db, client, json_data):
+    client.login(username='editor', password='editor')
+
+    response = client.post(reverse(urlnames['import']), {**json_data, 'job': True}, content_type='application/json')
+    assert response.status_code == 202
+
+    # a job, which is running and reported progress recently, is left alone
+    job_id = response.json()['id']
+    ImportJob.objects.filter(id=job_id).update(status=ImportJob.STATUS_RUNNING, processed=1, updated=now())
+
+    call_command('run_import_jobs')
+
+    job = ImportJob.objects.get(id=job_id)
+    assert job.status == ImportJob.STATUS_RUNNING
+    assert job.processed == 1
+
+
+def test_list(db, client):
+    ImportJob.objects.create(user=None)
+
+    job = ImportJob.objects.create(user=User.objects.get(username='editor'))
+
+    client.login(username='editor', password='editor')
+
+    response = client.get(reverse(urlnames['list']))
+    assert response.status_code == 200
+    assert [item['id'] for item in response.json()] == [job.id]
@@ -2,7 +2,7 @@ from django.urls import include, path
 
 from rest_framework import routers
 
-from ..viewsets import ImportViewSet, MetaViewSet, UploadViewSet
+from ..viewsets import ImportJobViewSet, ImportViewSet, MetaViewSet, UploadViewSet
 
 app_name = 'v1-management'
 
@@ -10,6 +10,7 @@ router = routers.DefaultRouter()
 router.register(r'meta', MetaViewSet, basename='meta')
 router.register(r'upload', UploadViewSet, basename='upload')
 router.register(r'import', ImportViewSet, basename='import')
+router.register(r'jobs', ImportJobViewSet, basename='job')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -3,7 +3,7 @@ import logging
 from django.contrib.sites.shortcuts import get_current_site
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -16,6 +16,9 @@ from rdmo.core.xml import parse_xml_to_elements
 
 from .constants import RDMO_MODEL_PATH_MAPPER
 from .imports import import_elements
+from .jobs import start_import_job
+from .models import ImportJob
+from .serializers.v1 import ImportJobDetailSerializer, ImportJobSerializer
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,18 @@ class UploadViewSet(viewsets.ViewSet):
             raise ValidationError({'file': [_('This field may not be blank.')]}) from e
         else:
             import_tmpfile_name = handle_uploaded_file(uploaded_file)
+
+        if is_truthy(request.POST.get('job')):
+            # parse and import the file in the background
+            job = ImportJob.objects.create(
+                user=request.user,
+                site=get_current_site(request),
+                save_elements=is_truthy(request.POST.get('import')),
+                file_name=import_tmpfile_name
+            )
+            start_import_job(job)
+            return Response(ImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
         try:
             # step 1.1: initialize parse_xml_to_elements
             # step 2-6: parse xml, validate and convert to
@@ -77,6 +92,16 @@ class ImportViewSet(viewsets.ViewSet):
         except TypeError as e:
             raise ValidationError({'elements': [_('This is not a valid RDMO import JSON.')]}) from e
 
+        if is_truthy(request.data.get('job')):
+            # import the elements in the background
+            job = ImportJob.objects.create(
+                user=request.user,
+                site=get_current_site(request),
+                elements=list(elements.values())
+            )
+            start_import_job(job)
+            return Response(ImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
         # step 3: import the elements
         imported_elements = import_elements(elements, request=request)
 
@@ -84,6 +109,16 @@ class ImportViewSet(viewsets.ViewSet):
         return Response(imported_elements)
 
 
+class ImportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    permission_classes = (IsAuthenticated, )
+
+    def get_queryset(self):
+        return ImportJob.objects.filter(user=self.request.user)
+
+    def get_serializer_class(self):
+        return ImportJobDetailSerializer if self.action == 'retrieve' else ImportJobSerializer
+
+
 class ElementToggleCurrentSiteViewSetMixin:
 
     @action(detail=True, methods=['put'], url_path="toggle-site", permission_classes=[CanToggleElementCurrentSite])
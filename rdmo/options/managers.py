@@ -0,0 +1,30 @@
+from django.db import models
+
+from rdmo.core.managers import LockedManagerMixin, LockedQuerySetMixin
+
+
+class OptionSetQuerySet(LockedQuerySetMixin, models.QuerySet):
+
+    pass
+
+
+class OptionSetManager(LockedManagerMixin, models.Manager):
+
+    def get_queryset(self):
+        return OptionSetQuerySet(self.model, using=self._db)
+
+
+class OptionQuerySet(LockedQuerySetMixin, models.QuerySet):
+
+    def get_locked_filter(self):
+        from .models import OptionSetOption  # to prevent circular inclusion
+
+        return models.Q(locked=True) | models.Q(models.Exists(
+            OptionSetOption.objects.filter(option=models.OuterRef('pk'), optionset__locked=True)
+        ))
+
+
+class OptionManager(LockedManagerMixin, models.Manager):
+
+    def get_queryset(self):
+        return OptionQuerySet(self.model, using=self._db)
@@ -11,6 +11,8 @@ from rdmo.core.models import TranslationMixin
 from rdmo.core.plugins import get_plugin
 from rdmo.core.utils import join_url
 
+from .managers import OptionManager, OptionSetManager
+
 
 class OptionSet(models.Model):
 
@@ -65,6 +67,8 @@ class OptionSet(models.Model):
         help_text=_('The list of conditions evaluated for this option set.')
     )
 
+    objects = OptionSetManager()
+
     class Meta:
         ordering = ('uri', )
         verbose_name = _('Option set')
@@ -286,6 +290,8 @@ class Option(models.Model, TranslationMixin):
         help_text=_('Designates whether an additional input is possible for this option.')
     )
 
+    objects = OptionManager()
+
     class Meta:
         ordering = ('uri', )
         verbose_name = _('Option')
@@ -322,9 +328,9 @@ class Option(models.Model, TranslationMixin):
     def label(self) -> str:
         return f'{self.uri} ("{self.text}")'
 
-    @property
+    @cached_property
     def is_locked(self) -> bool:
-        return self.locked or self.optionsets.filter(locked=True).exists()
+        return self.locked or any(optionset.locked for optionset in self.optionsets.all())
 
     @classmethod
     def build_uri(cls, uri_prefix, uri_path):
@@ -23,3 +23,13 @@ def test_options_clean(db):
     instances = Option.objects.all()
     for instance in instances:
         instance.clean()
+
+
+def test_option_annotate_is_locked(db):
+    optionset = OptionSet.objects.first()
+    optionset.locked = True
+    optionset.save()
+
+    for instance in Option.objects.annotate_is_locked():
+        assert instance.is_locked == Option.objects.get(id=instance.id).is_locked
+        assert instance.is_locked == (instance.locked or optionset in instance.optionsets.all())
@@ -1,3 +1,6 @@
+import operator
+from functools import reduce
+
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db.models import F, OuterRef, Q, Subquery
@@ -10,6 +13,7 @@ from rest_framework.filters import BaseFilterBackend, OrderingFilter, SearchFilt
 from django_filters import CharFilter, FilterSet
 
 from .models import Membership, Project
+from .search import get_search_index, get_value_search_index
 
 
 class ProjectFilter(FilterSet):
@@ -43,17 +47,38 @@ class ProjectSearchFilterBackend(SearchFilter):
 
         search_terms = self.get_search_terms(request)
         if search_terms:
+            # the title, the description and the owners are part of the search document of the project
+            search_index = get_search_index(Project, 'search_document', queryset.db)
             for search_term in search_terms:
-                queryset = queryset.filter(
-                    Q(title__icontains=search_term) | (
-                        Q(memberships__role='owner') & (
-                            Q(memberships__user__username__icontains=search_term) |
-                            Q(memberships__user__first_name__icontains=search_term) |
-                            Q(memberships__user__last_name__icontains=search_term) |
-                            Q(memberships__user__email__icontains=search_term)
-                        )
-                    )
-                )
+                queryset = queryset.filter(search_index.get_filter(search_term))
+
+            # order the projects by relevance, unless a different ordering was requested
+            search_rank = search_index.get_rank(search_terms)
+            if search_rank is not None and not request.GET.get('ordering'):
+                queryset = queryset.annotate(search_rank=search_rank).order_by('-search_rank')
+
+        return queryset
+
+
+class ValueSearchFilterBackend(SearchFilter):
+
+    def filter_queryset(self, request, queryset, view):
+        if view.detail:
+            return queryset
+
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if search_fields and search_terms:
+            # the field of the search index is searched using the index for the database,
+            # the other search fields using icontains lookups
+            search_index = get_value_search_index(queryset.db)
+            for search_term in search_terms:
+                queries = [
+                    search_index.get_filter(search_term) if search_field == search_index.field_name
+                    else Q(**{f'{search_field}__icontains': search_term})
+                    for search_field in search_fields
+                ]
+                queryset = queryset.filter(reduce(operator.or_, queries))
 
         return queryset
 
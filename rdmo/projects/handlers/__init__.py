@@ -1 +1,9 @@
-from . import membership_changed, project_changed_catalog, task_changed, view_changed  # noqa: F401
+from . import (  # noqa: F401
+    membership_changed,
+    permission_cache,
+    project_changed_catalog,
+    search_document,
+    task_changed,
+    value_changed,
+    view_changed,
+)
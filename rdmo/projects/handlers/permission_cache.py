@@ -0,0 +1,20 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from rdmo.accounts.models import Role
+
+from ..models import Membership, Project
+from ..rules import clear_permission_cache
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def post_save_clear_permission_cache(sender, **kwargs):
+    clear_permission_cache()
+
+
+@receiver(m2m_changed, sender=Role.manager.through)
+def m2m_changed_role_manager_clear_permission_cache(sender, **kwargs):
+    clear_permission_cache()
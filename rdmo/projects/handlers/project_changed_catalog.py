@@ -6,7 +6,7 @@ from rdmo.tasks.models import Task
 from rdmo.views.models import View
 
 from ..models import Project
-from ..sync import sync_tasks_or_views_for_project
+from ..sync import enqueue_sync_tasks_or_views_for_project
 
 
 @receiver(pre_save, sender=Project)
@@ -27,10 +27,10 @@ def pre_save_check_if_catalog_was_changed(sender, instance, raw, update_fields,
 @receiver(post_save, sender=Project)
 def post_save_project_sync_tasks_when_catalog_was_changed(sender, instance, created, raw, update_fields, **kwargs):
     if settings.PROJECT_TASKS_SYNC and not raw and (instance._catalog_was_changed or created):
-        sync_tasks_or_views_for_project(Task, instance)
+        enqueue_sync_tasks_or_views_for_project(Task, instance)
 
 
 @receiver(post_save, sender=Project)
 def post_save_project_sync_views_when_catalog_was_changed(sender, instance, created, raw, update_fields, **kwargs):
     if settings.PROJECT_VIEWS_SYNC and not raw and (instance._catalog_was_changed or created):
-        sync_tasks_or_views_for_project(View, instance)
+        enqueue_sync_tasks_or_views_for_project(View, instance)
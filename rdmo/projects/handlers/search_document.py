@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Membership, Project
+from ..search import get_search_index
+from ..utils import compute_search_document, store_search_documents
+
+
+@receiver(post_save, sender=Project)
+def post_save_project_search_document(sender, instance, using, **kwargs):
+    # only update the search document if the title or the description have changed
+    title, description, *_ = compute_search_document(instance).split('\n')
+    if instance.search_document.split('\n')[:2] != [title, description]:
+        store_search_documents([instance.id], using)
+
+
+@receiver(post_delete, sender=Project)
+def post_delete_project_search_document(sender, instance, using, **kwargs):
+    get_search_index(Project, 'search_document', using).delete([instance.id])
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def post_save_membership_search_document(sender, instance, using, origin=None, **kwargs):
+    # skip the memberships deleted together with their project
+    if not (isinstance(origin, Project) or getattr(origin, 'model', None) is Project):
+        store_search_documents([instance.project_id], using)
+
+
+@receiver(post_save, sender=User)
+def post_save_user_search_document(sender, instance, using, update_fields=None, **kwargs):
+    # skip e.g. the update of last_login
+    if update_fields is None or {'username', 'first_name', 'last_name', 'email'} & set(update_fields):
+        project_ids = list(Membership.objects.using(using).filter(user=instance, role='owner')
+                                                          .values_list('project_id', flat=True))
+        if project_ids:
+            store_search_documents(project_ids, using)
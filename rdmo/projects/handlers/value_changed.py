@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Value
+from ..search import get_value_search_index
+from ..utils import store_last_changed
+
+
+@receiver(post_save, sender=Value)
+def post_save_value_last_changed(sender, instance, created, raw, update_fields, **kwargs):
+    if instance.snapshot_id is None and not raw:
+        store_last_changed([instance.project_id], instance.updated)
+
+
+@receiver(post_delete, sender=Value)
+def post_delete_value_last_changed(sender, instance, origin=None, **kwargs):
+    # only single values are considered here, values deleted using querysets are handled
+    # where the queryset is deleted, and values deleted with their project are ignored
+    if instance.snapshot_id is None and isinstance(origin, Value):
+        store_last_changed([instance.project_id])
+
+
+@receiver(post_save, sender=Value)
+def post_save_value_search_index(sender, instance, using, **kwargs):
+    get_value_search_index(using).store([instance])
+
+
+@receiver(post_delete, sender=Value)
+def post_delete_value_search_index(sender, instance, using, **kwargs):
+    get_value_search_index(using).delete([instance.pk])
@@ -4,28 +4,28 @@ from django.dispatch import receiver
 
 from rdmo.views.models import View
 
-from ..sync import sync_task_or_view_to_projects
+from ..sync import enqueue_sync_task_or_view_to_projects
 
 
 @receiver(post_save, sender=View)
 def view_changed_availability_handler(sender, instance, created, raw, update_fields, **kwargs):
     if settings.PROJECT_VIEWS_SYNC and not raw:
-        sync_task_or_view_to_projects(instance)
+        enqueue_sync_task_or_view_to_projects(instance)
 
 
 @receiver(m2m_changed, sender=View.catalogs.through)
 def m2m_changed_view_catalog_signal(sender, instance, action, **kwargs):
     if settings.PROJECT_VIEWS_SYNC and action in ['post_add', 'post_remove', 'post_clear']:
-        sync_task_or_view_to_projects(instance)
+        enqueue_sync_task_or_view_to_projects(instance)
 
 
 @receiver(m2m_changed, sender=View.sites.through)
 def m2m_changed_view_sites_signal(sender, instance, action, **kwargs):
     if settings.PROJECT_VIEWS_SYNC and action in ['post_add', 'post_remove', 'post_clear']:
-        sync_task_or_view_to_projects(instance)
+        enqueue_sync_task_or_view_to_projects(instance)
 
 
 @receiver(m2m_changed, sender=View.groups.through)
 def m2m_changed_view_groups_signal(sender, instance, action, **kwargs):
     if settings.PROJECT_VIEWS_SYNC and action in ['post_add', 'post_remove', 'post_clear']:
-        sync_task_or_view_to_projects(instance)
+        enqueue_sync_task_or_view_to_projects(instance)
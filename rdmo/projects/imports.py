@@ -39,10 +39,12 @@ class Import(Plugin):
         self.project = None
         self.catalog = None
 
-        self._attributes = {attribute.uri: attribute for attribute in Attribute.objects.all()}
-        self._options = {option.uri: option for option in Option.objects.all()}
-        self._tasks = {task.uri: task for task in Task.objects.all()}
-        self._views = {view.uri: view for view in View.objects.all()}
+        # the lookup maps are filled lazily, either in bulk by prefetch_elements
+        # or one uri at a time when an element is requested by the plugin
+        self._attributes = {}
+        self._options = {}
+        self._tasks = {}
+        self._views = {}
 
         self.values = []
         self.snapshots = []
@@ -61,29 +63,39 @@ class Import(Plugin):
     def process(self):
         raise NotImplementedError
 
+    def prefetch_elements(self, attribute_uris=(), option_uris=(), task_uris=(), view_uris=()):
+        # load the elements for the uris used in the imported file in bulk, one query per model
+        for model, elements, uris in (
+            (Attribute, self._attributes, attribute_uris),
+            (Option, self._options, option_uris),
+            (Task, self._tasks, task_uris),
+            (View, self._views, view_uris),
+        ):
+            uris = {uri for uri in uris if uri and uri not in elements}
+            if uris:
+                elements.update(dict.fromkeys(uris))
+                elements.update({instance.uri: instance for instance in model.objects.filter(uri__in=uris)})
+
+    def get_element(self, model, elements, uri):
+        if uri not in elements:
+            elements[uri] = model.objects.filter(uri=uri).first()
+
+        element = elements[uri]
+        if element is None:
+            log.info('%s %s not in db. Skipping.', model._meta.object_name, uri)
+        return element
+
     def get_attribute(self, attribute_uri):
-        try:
-            return self._attributes.get(attribute_uri)
-        except KeyError:
-            log.info('Attribute %s not in db. Skipping.', attribute_uri)
+        return self.get_element(Attribute, self._attributes, attribute_uri)
 
     def get_option(self, option_uri):
-        try:
-            return self._options.get(option_uri)
-        except KeyError:
-            log.info('Option %s not in db. Skipping.', option_uri)
+        return self.get_element(Option, self._options, option_uri)
 
     def get_task(self, tasks_uri):
-        try:
-            return self._tasks.get(tasks_uri)
-        except KeyError:
-            log.info('Task %s not in db. Skipping.', tasks_uri)
+        return self.get_element(Task, self._tasks, tasks_uri)
 
     def get_view(self, view_uri):
-        try:
-            return self._views.get(view_uri)
-        except KeyError:
-            log.info('View %s not in db. Skipping.', view_uri)
+        return self.get_element(View, self._views, view_uri)
 
 
 class RDMOXMLImport(Import):
@@ -126,6 +138,14 @@ class RDMOXMLImport(Import):
         else:
             self.catalog = self.current_project.catalog
 
+        # fetch all attributes, options, tasks and views used in the file at once
+        self.prefetch_elements(
+            attribute_uris=self.get_uris('attribute'),
+            option_uris=self.get_uris('option'),
+            task_uris=self.get_uris('task'),
+            view_uris=self.get_uris('view'),
+        )
+
         tasks_node = self.root.find('tasks')
         if tasks_node is not None:
             for task_node in tasks_node.findall('task'):
@@ -169,6 +189,9 @@ class RDMOXMLImport(Import):
 
                     self.snapshots.append(snapshot)
 
+    def get_uris(self, tag):
+        return {uri for node in self.root.iter(tag) if (uri := get_uri(node, self.ns_map))}
+
     def get_value(self, value_node):
         value = Value()
 
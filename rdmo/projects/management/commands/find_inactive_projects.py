@@ -3,11 +3,9 @@ import sys
 from datetime import datetime
 
 from django.core.management.base import BaseCommand
-from django.db import models
-from django.db.models.functions import Greatest
 from django.utils import timezone
 
-from rdmo.projects.models import Project, Value
+from rdmo.projects.models import Project
 
 
 class Command(BaseCommand):
@@ -22,14 +20,7 @@ class Command(BaseCommand):
                             help='Store the output in a csv file.')
 
     def handle(self, *args, **options):
-        # prepare subquery for last_changed
-        last_changed_subquery = models.Subquery(
-            Value.objects.filter(project=models.OuterRef('pk')).order_by('-updated').values('updated')[:1]
-        )
-
-        # prepare actual query
-        rows = Project.objects.annotate(last_changed=Greatest('updated', last_changed_subquery)) \
-                              .filter(last_changed__lt=options['since']) \
+        rows = Project.objects.filter(last_changed__lt=options['since']) \
                               .order_by('-last_changed') \
                               .values_list(*self.columns)
 
@@ -1,8 +1,10 @@
+import time
+
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
 from rdmo.projects.models import Project
-from rdmo.projects.sync import sync_task_or_view_to_projects
+from rdmo.projects.sync import sync_tasks_or_views_to_projects
 from rdmo.tasks.models import Task
 from rdmo.views.models import View
 
@@ -14,8 +16,10 @@ class Command(BaseCommand):
         parser.add_argument('--tasks', action='store_true', help='Sync all tasks to projects')
         parser.add_argument('--views', action='store_true', help='Sync all views to projects')
         parser.add_argument('--show', action='store_true', help='Display tasks and views per project.')
+        parser.add_argument('--dry-run', action='store_true', help='Only display the changes, do not apply them.')
 
     def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
         show = options['show']
         if not options['tasks'] and not options['views']:
             if show:
@@ -41,23 +45,32 @@ class Command(BaseCommand):
             self.show_project_tasks_and_views()
 
     def sync_all_tasks_or_views_to_projects(self, model):
-        queryset = model.objects.filter(available=True)
+        instances = list(model.objects.filter(available=True))
         model_name = model._meta.verbose_name_plural
-        qs_count = queryset.count()
 
-        self.stdout.write(self.style.SUCCESS(f'Starting sync for {qs_count} available {model_name}...'))
-        for instance in queryset:
+        self.stdout.write(self.style.SUCCESS(f'Starting sync for {len(instances)} available {model_name}...'))
+        for instance in instances:
             self.stdout.write(f'- Syncing: {instance}')
-            sync_task_or_view_to_projects(instance)
+
+        start = time.monotonic()
+        added, removed = sync_tasks_or_views_to_projects(model, instances, dry_run=self.dry_run)
+        duration = time.monotonic() - start
+
+        if self.dry_run:
+            self.stdout.write(f'Would add {len(added)} and remove {len(removed)} project {model_name} (dry run).')
+        else:
+            self.stdout.write(f'Added {len(added)} and removed {len(removed)} project {model_name}.')
+        self.stdout.write(f'Took {duration:.2f}s.')
 
         self.stdout.write(self.style.SUCCESS(f'Finished sync for {model_name}.\n'))
 
     def show_project_tasks_and_views(self):
         self.stdout.write(self.style.SUCCESS('Displaying tasks and views for each project...'))
 
-        for project in Project.objects.all():
-            task_uris = sorted(project.tasks.values_list("uri", flat=True))
-            view_uris = sorted(project.views.values_list("uri", flat=True))
+        projects = Project.objects.select_related('catalog').prefetch_related('tasks', 'views')
+        for project in projects:
+            task_uris = sorted(task.uri for task in project.tasks.all())
+            view_uris = sorted(view.uri for view in project.views.all())
 
             self.stdout.write(f'Project "{project.title}" [id={project.id}]:')
             self.stdout.write(f'- Catalog: {project.catalog.uri}')
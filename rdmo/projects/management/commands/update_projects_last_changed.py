@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from rdmo.projects.models import Project
+from rdmo.projects.utils import compute_last_changed
+
+
+class Command(BaseCommand):
+    help = 'Compute the last_changed field of the projects from the projects and their values.'
+
+    def handle(self, *args, **options):
+        count = compute_last_changed(Project.objects.all())
+
+        self.stdout.write(self.style.SUCCESS(f'Updated last_changed for {count} projects.'))
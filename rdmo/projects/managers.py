@@ -2,7 +2,7 @@ from collections import defaultdict
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 
 from mptt.models import TreeManager
 from mptt.querysets import TreeQuerySet
@@ -37,10 +37,13 @@ class ProjectQuerySet(TreeQuerySet):
                 # create queryset by combining all three filters
                 queryset = self.filter(user_filter | visibility_filter | current_site_filter)
 
-                # add descendant projects
-                for instance in queryset:
-                    queryset |= instance.get_descendants()
-                return queryset.distinct()
+                # add descendant projects, i.e. all projects in the (tree_id, lft, rght) range
+                # of one of the projects above, the projects themselves are included in the range
+                return self.filter(Exists(queryset.filter(
+                    tree_id=OuterRef('tree_id'),
+                    lft__lte=OuterRef('lft'),
+                    rght__gte=OuterRef('rght')
+                )))
         else:
             return self.none()
 
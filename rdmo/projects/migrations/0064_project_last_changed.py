@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0063_alter_value_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='last_changed',
+            field=models.DateTimeField(db_index=True, editable=False, help_text='The date and time of the last change of this project or its values.', null=True, verbose_name='Last changed'),
+        ),
+    ]
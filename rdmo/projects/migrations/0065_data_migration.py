@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+
+def run_data_migration(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Value = apps.get_model('projects', 'Value')
+
+    last_changed_subquery = Subquery(
+        Value.objects.filter(project=OuterRef('pk')).order_by('-updated').values('updated')[:1]
+    )
+    Project.objects.update(last_changed=Coalesce(Greatest(last_changed_subquery, 'updated'), 'updated'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0064_project_last_changed'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_data_migration, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+import logging
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        # the pg_trgm extension needs to be installed by a privileged user, see PROJECT_SEARCH_TRIGRAM_INDEX
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                logger.warning('The pg_trgm extension is not installed, '
+                               'the index projects_value_text_search was not created.')
+                return
+
+        schema_editor.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_value_text_search '
+                              'ON projects_value USING gin (UPPER(text::text) gin_trgm_ops)')
+
+    elif connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 34, 0):
+        # the trigram tokenizer was added in SQLite 3.34
+        schema_editor.execute('CREATE VIRTUAL TABLE IF NOT EXISTS projects_value_text_search '
+                              "USING fts5(text, tokenize='trigram')")
+        schema_editor.execute('INSERT INTO projects_value_text_search (rowid, text) '
+                              'SELECT id, text FROM projects_value WHERE text IS NOT NULL')
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS projects_value_text_search')
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS projects_value_text_search')
+
+
+class Migration(migrations.Migration):
+
+    # the index is created concurrently on PostgreSQL, which is not possible in a transaction
+    atomic = False
+
+    dependencies = [
+        ('projects', '0065_data_migration'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0066_value_text_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False, help_text='The text used to search for this project (title, description and owners).', verbose_name='Search document'),
+        ),
+    ]
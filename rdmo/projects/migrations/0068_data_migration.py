@@ -0,0 +1,76 @@
+import logging
+from collections import defaultdict
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+
+def run_data_migration(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Membership = apps.get_model('projects', 'Membership')
+
+    owners = defaultdict(list)
+    for membership in Membership.objects.filter(role='owner').select_related('user'):
+        user = membership.user
+        owners[membership.project_id] += [
+            word for word in (user.username, user.first_name, user.last_name, user.email) if word
+        ]
+
+    # one line for the title, the description and the owners, see rdmo.projects.utils.compute_search_document
+    projects = list(Project.objects.only('id', 'title', 'description'))
+    for project in projects:
+        project.search_document = '\n'.join([
+            project.title,
+            ' '.join(project.description.split()),
+            ' '.join(owners[project.id])
+        ])
+
+    Project.objects.bulk_update(projects, ('search_document', ), batch_size=1000)
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        # the pg_trgm extension needs to be installed by a privileged user, see PROJECT_SEARCH_TRIGRAM_INDEX
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                logger.warning('The pg_trgm extension is not installed, '
+                               'the index projects_project_search_document_search was not created.')
+                return
+
+        schema_editor.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_project_search_document_search '
+                              'ON projects_project USING gin (UPPER(search_document::text) gin_trgm_ops)')
+
+    elif connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 34, 0):
+        # the trigram tokenizer was added in SQLite 3.34
+        schema_editor.execute('CREATE VIRTUAL TABLE IF NOT EXISTS projects_project_search_document_search '
+                              "USING fts5(text, tokenize='trigram')")
+        schema_editor.execute('INSERT INTO projects_project_search_document_search (rowid, text) '
+                              'SELECT id, search_document FROM projects_project')
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS projects_project_search_document_search')
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS projects_project_search_document_search')
+
+
+class Migration(migrations.Migration):
+
+    # the index is created concurrently on PostgreSQL, which is not possible in a transaction
+    atomic = False
+
+    dependencies = [
+        ('projects', '0067_project_search_document'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_data_migration, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
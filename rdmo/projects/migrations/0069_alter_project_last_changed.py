@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:04
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def run_data_migration(apps, schema_editor):
+    # projects which were not covered by 0065_data_migration get their updated timestamp
+    Project = apps.get_model('projects', 'Project')
+    Project.objects.filter(last_changed=None).update(last_changed=F('updated'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0068_data_migration'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_data_migration, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='project',
+            name='last_changed',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False, help_text='The date and time of the last change of this project or its values.', verbose_name='Last changed'),
+        ),
+    ]
@@ -6,6 +6,7 @@ from django.db.models.signals import pre_delete
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from mptt.models import MPTTModel, TreeForeignKey
@@ -74,6 +75,16 @@ class Project(MPTTModel, Model):
         verbose_name=_('Progress count'),
         help_text=_('The number of values for the progress bar.')
     )
+    last_changed = models.DateTimeField(
+        default=now, editable=False, db_index=True,
+        verbose_name=_('Last changed'),
+        help_text=_('The date and time of the last change of this project or its values.')
+    )
+    search_document = models.TextField(
+        blank=True, editable=False,
+        verbose_name=_('Search document'),
+        help_text=_('The text used to search for this project (title, description and owners).')
+    )
 
     class Meta:
         ordering = ('tree_id', 'level', 'title')
@@ -94,6 +105,8 @@ class Project(MPTTModel, Model):
         if self.id and self.parent in self.get_descendants(include_self=True):
             raise RuntimeError('A project may not be moved to be a child of itself or one of its descendants.')
 
+        self.last_changed = now()
+
         super().save(*args, **kwargs)
 
     @property
@@ -1,10 +1,12 @@
 from django.db import models
 from django.urls import reverse
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from rdmo.core.models import Model
 
 from ..managers import SnapshotManager
+from ..utils import store_last_changed
 
 
 class Snapshot(Model):
@@ -55,11 +57,17 @@ class Snapshot(Model):
                 if value.file:
                     value.copy_file(value.file_name, value.file)
 
+            store_last_changed([self.project_id])
+
     def rollback(self):
         # remove all current values for this project
         self.project.values.filter(snapshot=None).delete()
 
-        # remove the snapshot_id from this snapshots values so they are current values
+        # remove the snapshot_id from this snapshots values so they are current values,
+        # values without files are updated using one query, since Value.save is not needed
+        timestamp = now()
+        self.values.filter(models.Q(file=None) | models.Q(file='')).update(snapshot=None, updated=timestamp)
+
         for value in self.values.all():
             value.snapshot = None
             value.save()
@@ -72,3 +80,5 @@ class Snapshot(Model):
         # this also removes the values of these snapshots
         for snapshot in self.project.snapshots.filter(created__gte=self.created):
             snapshot.delete()
+
+        store_last_changed([self.project_id], timestamp)
@@ -1,8 +1,76 @@
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import FilteredRelation, Q
 
 import rules
 
+from .models import Project
+
+# the permission cache is stored on the user object, which is created for every request,
+# the generation is increased by the handlers in handlers/permission_cache.py,
+# when memberships, projects or site managers change during the request
+permission_cache_generation = 0
+
+
+def clear_permission_cache():
+    global permission_cache_generation
+    permission_cache_generation += 1
+
+
+def get_permission_cache(user):
+    cache = getattr(user, '_project_permission_cache', None)
+    if cache is None or cache['generation'] != permission_cache_generation:
+        cache = user._project_permission_cache = {
+            'generation': permission_cache_generation,
+            'projects': {},
+            'sites': None
+        }
+    return cache
+
+
+def get_project_roles(user, project):
+    """
+    Returns the roles of the user for the project itself and for the project or any of its
+    ancestors. The whole ancestor chain is resolved using one query and cached for the request.
+    """
+    if not user.is_authenticated or project.id is None:
+        return frozenset(), frozenset()
+
+    cache = get_permission_cache(user)['projects']
+    if project.id not in cache and project.parent_id is None and hasattr(project, 'memberships_list'):
+        # the memberships of a root project were already prefetched, e.g. in the ProjectViewSet
+        roles = frozenset(membership.role for membership in project.memberships_list if membership.user_id == user.id)
+        cache[project.id] = (roles, roles)
+
+    if project.id not in cache:
+        rows = Project.objects.filter(tree_id=project.tree_id, lft__lte=project.lft, rght__gte=project.rght) \
+                              .annotate(user_memberships=FilteredRelation(
+                                  'memberships', condition=Q(memberships__user=user)
+                              )) \
+                              .order_by('lft') \
+                              .values_list('id', 'user_memberships__role')
+
+        # the ancestors are ordered from the root to the project, so that the roles can be accumulated
+        project_roles = {}
+        for project_id, role in rows:
+            project_roles.setdefault(project_id, set())
+            if role is not None:
+                project_roles[project_id].add(role)
+
+        inherited_roles = set()
+        for project_id, roles in project_roles.items():
+            inherited_roles |= roles
+            cache[project_id] = (frozenset(roles), frozenset(inherited_roles))
+
+    return cache.get(project.id, (frozenset(), frozenset()))
+
+
+def get_site_manager_ids(user):
+    cache = get_permission_cache(user)
+    if cache['sites'] is None:
+        cache['sites'] = frozenset(user.role.manager.values_list('pk', flat=True))
+    return cache['sites']
+
 
 @rules.predicate
 def can_add_project(user):
@@ -17,32 +85,32 @@ def can_add_project(user):
 
 @rules.predicate
 def is_project_member(user, project):
-    return user in project.member or (project.parent and is_project_member(user, project.parent))
+    return bool(get_project_roles(user, project)[1])
 
 
 @rules.predicate
 def is_current_project_member(user, project):
-    return user in project.member
+    return bool(get_project_roles(user, project)[0])
 
 
 @rules.predicate
 def is_project_owner(user, project):
-    return user in project.owners or (project.parent and is_project_owner(user, project.parent))
+    return 'owner' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_manager(user, project):
-    return user in project.managers or (project.parent and is_project_manager(user, project.parent))
+    return 'manager' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_author(user, project):
-    return user in project.authors or (project.parent and is_project_author(user, project.parent))
+    return 'author' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_guest(user, project):
-    return user in project.guests or (project.parent and is_project_guest(user, project.parent))
+    return 'guest' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
@@ -59,7 +127,7 @@ def is_visible(user, project):
 @rules.predicate
 def is_site_manager(user, project):
     if user.is_authenticated:
-        return user.role.manager.filter(pk=project.site.pk).exists()
+        return project.site_id in get_site_manager_ids(user)
     else:
         return False
 
@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+
+class SearchIndex:
+    '''
+    Default search index, which uses icontains lookups and needs no maintenance.
+    The subclasses below are used depending on the database vendor. The tables
+    and indexes are created by the migrations (e.g. 0066_value_text_search).
+    '''
+
+    def __init__(self, model, field_name, using=DEFAULT_DB_ALIAS):
+        self.model = model
+        self.field_name = field_name
+        self.using = using
+
+    @property
+    def table_name(self):
+        return f'{self.model._meta.db_table}_{self.field_name}_search'
+
+    @property
+    def qualified_column_name(self):
+        quote_name = connections[self.using].ops.quote_name
+        column_name = self.model._meta.get_field(self.field_name).column
+        return f'{quote_name(self.model._meta.db_table)}.{quote_name(column_name)}'
+
+    @property
+    def qualified_pk_name(self):
+        quote_name = connections[self.using].ops.quote_name
+        return f'{quote_name(self.model._meta.db_table)}.{quote_name(self.model._meta.pk.column)}'
+
+    @classmethod
+    def is_supported(cls, connection):
+        return True
+
+    def get_filter(self, search):
+        return Q(**{f'{self.field_name}__icontains': search})
+
+    def get_rank(self, search_terms):
+        # an expression to order the results by relevance (higher is better), if the index supports it
+        return None
+
+    def store(self, instances):
+        pass
+
+    def delete(self, pks):
+        pass
+
+
+class PostgreSQLSearchIndex(SearchIndex):
+    '''
+    Uses a trigram index on UPPER(field), which PostgreSQL uses for the UPPER(field) LIKE UPPER(%s)
+    queries created by icontains. The index is maintained by the database. It is only used if
+    PROJECT_SEARCH_TRIGRAM_INDEX is set, since the pg_trgm extension needs to be installed manually.
+    '''
+
+    @classmethod
+    def is_supported(cls, connection):
+        return settings.PROJECT_SEARCH_TRIGRAM_INDEX
+
+    def get_rank(self, search_terms):
+        return RawSQL(f'similarity(UPPER({self.qualified_column_name}::text), UPPER(%s))', (' '.join(search_terms), ))
+
+
+class SQLiteSearchIndex(SearchIndex):
+    '''
+    Uses a FTS5 table with the trigram tokenizer, which is maintained by the signal handlers
+    in handlers/value_changed.py, handlers/search_document.py and after bulk operations.
+    '''
+
+    # the trigram tokenizer cannot match strings shorter than three characters
+    min_length = 3
+
+    @classmethod
+    def is_supported(cls, connection):
+        # the trigram tokenizer was added in SQLite 3.34
+        return connection.Database.sqlite_version_info >= (3, 34, 0)
+
+    def get_filter(self, search):
+        if len(search) < self.min_length:
+            return super().get_filter(search)
+
+        return Q(pk__in=RawSQL(f'SELECT rowid FROM {self.table_name} WHERE {self.table_name} MATCH %s',
+                               (self.get_phrase(search), )))
+
+    def get_rank(self, search_terms):
+        phrases = [self.get_phrase(search) for search in search_terms if len(search) >= self.min_length]
+        if not phrases:
+            return None
+
+        # bm25 returns lower values for better matches
+        return RawSQL(f'SELECT -bm25({self.table_name}) FROM {self.table_name} '
+                      f'WHERE {self.table_name} MATCH %s AND rowid = {self.qualified_pk_name}',
+                      (' AND '.join(phrases), ))
+
+    def get_phrase(self, search):
+        # the search is used as one phrase, double quotes need to be escaped by doubling them
+        return '"{}"'.format(search.replace('"', '""'))
+
+    def store(self, instances):
+        rows = [(instance.pk, getattr(instance, self.field_name) or '') for instance in instances if instance.pk]
+        if rows:
+            with connections[self.using].cursor() as cursor:
+                cursor.executemany(f'INSERT OR REPLACE INTO {self.table_name} (rowid, text) VALUES (%s, %s)', rows)
+
+    def delete(self, pks):
+        rows = [(pk, ) for pk in pks if pk]
+        if rows:
+            with connections[self.using].cursor() as cursor:
+                cursor.executemany(f'DELETE FROM {self.table_name} WHERE rowid = %s', rows)
+
+
+search_index_classes = {
+    'postgresql': PostgreSQLSearchIndex,
+    'sqlite': SQLiteSearchIndex
+}
+
+
+def get_search_index(model, field_name, using=None):
+    using = using or DEFAULT_DB_ALIAS
+    connection = connections[using]
+
+    search_index_class = search_index_classes.get(connection.vendor, SearchIndex)
+    if not search_index_class.is_supported(connection):
+        search_index_class = SearchIndex
+    return search_index_class(model, field_name, using)
+
+
+def get_value_search_index(using=None):
+    from .models import Value  # to prevent circular inclusion
+
+    return get_search_index(Value, 'text', using)
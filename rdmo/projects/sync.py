@@ -1,7 +1,10 @@
 import logging
+import threading
+from collections import defaultdict
 
 from django.conf import settings
-from django.db.models import Exists, OuterRef, Q
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
 
 from rdmo.tasks.models import Task
 from rdmo.views.models import View
@@ -10,6 +13,68 @@ from .models import Membership, Project
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
+
+
+class SyncQueue:
+    '''
+    Collects the tasks and views, and the projects, which need to be synchronized during a
+    transaction. Each of them is synchronized only once, when the transaction is committed,
+    even if it was changed several times (e.g. by the admin, which saves the m2m fields one by one).
+    '''
+
+    def __init__(self):
+        self.instances = defaultdict(set)
+        self.projects = defaultdict(set)
+        self.processed = False
+
+    def process(self):
+        self.processed = True
+
+        for model, instance_ids in self.instances.items():
+            for instance in model.objects.filter(id__in=instance_ids).order_by('id'):
+                sync_task_or_view_to_projects(instance)
+
+        for model, project_ids in self.projects.items():
+            for project in Project.objects.filter(id__in=project_ids).select_related('catalog', 'site').order_by('id'):
+                sync_tasks_or_views_for_project(model, project)
+
+
+def get_sync_queue():
+    # returns the queue of the current transaction, or None if there is no queue waiting for the commit,
+    # e.g. because it was already processed or discarded by the rollback of the transaction
+    queue = getattr(_local, 'sync_queue', None)
+    if queue is not None and not queue.processed and any(
+        func == queue.process for _savepoint_ids, func, _robust in transaction.get_connection().run_on_commit
+    ):
+        return queue
+
+
+def add_to_sync_queue(field, model, pk):
+    queue = get_sync_queue()
+    if queue is None:
+        queue = _local.sync_queue = SyncQueue()
+        getattr(queue, field)[model].add(pk)
+
+        # outside of a transaction, the queue is processed right away
+        transaction.on_commit(queue.process)
+    else:
+        getattr(queue, field)[model].add(pk)
+
+
+def enqueue_sync_task_or_view_to_projects(instance):
+    if settings.PROJECT_SYNC_QUEUE:
+        add_to_sync_queue('instances', type(instance), instance.id)
+    else:
+        sync_task_or_view_to_projects(instance)
+
+
+def enqueue_sync_tasks_or_views_for_project(model, project):
+    if settings.PROJECT_SYNC_QUEUE:
+        add_to_sync_queue('projects', model, project.id)
+    else:
+        sync_tasks_or_views_for_project(model, project)
+
 
 def sync_task_or_view_to_projects(instance):
     # get the m2m field for the Project model
@@ -144,3 +209,131 @@ def filter_projects_for_task_or_view(instance):
         queryset = queryset.filter_groups(instance.groups.all())
 
     return queryset.distinct()
+
+
+def compute_projects_for_tasks_or_views(model, instances):
+    '''
+    Computes the projects for many tasks or views at once, using the same rules as
+    filter_projects_for_task_or_view, but with a fixed number of queries. Returns a dict
+    which maps the id of every instance to the set of the ids of its projects.
+    '''
+    instance_ids = [instance.id for instance in instances]
+
+    # the catalogs, sites and groups of the instances
+    instance_relations = {}
+    for field in ('catalogs', 'sites', 'groups'):
+        instance_relations[field] = defaultdict(set)
+        for instance_id, related_id in model.objects.filter(id__in=instance_ids, **{f'{field}__isnull': False}) \
+                                                    .order_by().values_list('id', field):
+            instance_relations[field][instance_id].add(related_id)
+
+    # the projects by catalog and by site
+    project_ids = set()
+    projects_by_catalog = defaultdict(set)
+    projects_by_site = defaultdict(set)
+    for project_id, catalog_id, site_id in Project.objects.order_by().values_list('id', 'catalog_id', 'site_id'):
+        project_ids.add(project_id)
+        projects_by_catalog[catalog_id].add(project_id)
+        projects_by_site[site_id].add(project_id)
+
+    # the projects by the groups of their owners, see ProjectQuerySet.filter_groups
+    projects_by_group = defaultdict(set)
+    for project_id, group_id in Membership.objects.filter(role='owner', user__groups__isnull=False) \
+                                                  .order_by().values_list('project_id', 'user__groups'):
+        projects_by_group[group_id].add(project_id)
+
+    # the projects where all members have the view permission for the model, for unavailable instances
+    if any(not instance.available for instance in instances):
+        members_without_permission = Membership.objects.exclude(
+            Q(user__is_superuser=True) |
+            Q(user__user_permissions__content_type__app_label=model._meta.app_label,
+              user__user_permissions__codename=f'view_{model._meta.model_name}') |
+            Q(user__groups__permissions__content_type__app_label=model._meta.app_label,
+              user__groups__permissions__codename=f'view_{model._meta.model_name}') |
+            Q(user__role__editor=F('project__site_id')) |
+            Q(user__role__reviewer=F('project__site_id'))
+        )
+        permitted_project_ids = set(Membership.objects.order_by().values_list('project_id', flat=True)) - \
+            set(members_without_permission.order_by().values_list('project_id', flat=True))
+
+    instance_projects = {}
+    for instance in instances:
+        instance_project_ids = set(project_ids)
+
+        if not instance.available:
+            instance_project_ids &= permitted_project_ids
+
+        catalog_ids = instance_relations['catalogs'][instance.id]
+        if catalog_ids:
+            instance_project_ids &= set().union(*(projects_by_catalog[catalog_id] for catalog_id in catalog_ids))
+
+        site_ids = instance_relations['sites'][instance.id]
+        if site_ids:
+            instance_project_ids &= set().union(*(projects_by_site[site_id] for site_id in site_ids))
+        elif settings.MULTISITE:
+            instance_project_ids = set()
+
+        group_ids = instance_relations['groups'][instance.id]
+        if group_ids:
+            instance_project_ids &= set().union(*(projects_by_group[group_id] for group_id in group_ids))
+
+        instance_projects[instance.id] = instance_project_ids
+
+    return instance_projects
+
+
+def sync_tasks_or_views_to_projects(model, instances, dry_run=False):
+    '''
+    Synchronizes many tasks or views to the projects at once. The projects are computed using
+    compute_projects_for_tasks_or_views and compared to the rows of the through table, which
+    are then created and deleted in bulk. Returns the added and the removed (project_id, instance_id) pairs.
+    '''
+    # get the m2m field for the Project model
+    if model == Task:
+        field = Project._meta.get_field('tasks')
+    elif model == View:
+        field = Project._meta.get_field('views')
+    else:
+        raise RuntimeError('model needs to be Task or View')
+
+    through = field.remote_field.through
+    project_field_name = f'{field.m2m_field_name()}_id'
+    instance_field_name = f'{field.m2m_reverse_field_name()}_id'
+
+    instances = list(instances)
+    desired_pairs = {
+        (project_id, instance_id)
+        for instance_id, project_ids in compute_projects_for_tasks_or_views(model, instances).items()
+        for project_id in project_ids
+    }
+    current_pairs = set(
+        through.objects.filter(**{f'{instance_field_name}__in': [instance.id for instance in instances]})
+                       .order_by().values_list(project_field_name, instance_field_name)
+    )
+
+    to_add = sorted(desired_pairs - current_pairs)
+    to_remove = sorted(current_pairs - desired_pairs)
+
+    if not dry_run:
+        with transaction.atomic():
+            through.objects.bulk_create([
+                through(**{project_field_name: project_id, instance_field_name: instance_id})
+                for project_id, instance_id in to_add
+            ], batch_size=settings.PROJECT_SYNC_BATCH_SIZE)
+
+            # the rows are deleted per instance and in batches of project ids
+            project_ids_to_remove = defaultdict(list)
+            for project_id, instance_id in to_remove:
+                project_ids_to_remove[instance_id].append(project_id)
+
+            for instance_id, project_ids in project_ids_to_remove.items():
+                for i in range(0, len(project_ids), settings.PROJECT_SYNC_BATCH_SIZE):
+                    through.objects.filter(**{
+                        instance_field_name: instance_id,
+                        f'{project_field_name}__in': project_ids[i:i + settings.PROJECT_SYNC_BATCH_SIZE]
+                    }).delete()
+
+    logger.debug('Synced %s %s: %s added, %s removed', len(instances), model._meta.verbose_name_plural,
+                 len(to_add), len(to_remove))
+
+    return to_add, to_remove
@@ -17,7 +17,7 @@ def _suppress_project_task_sync():
     """Silence automatic project/task sync during test setup."""
     with (
         patch('rdmo.projects.sync.sync_task_or_view_to_projects'),
-        patch('rdmo.projects.handlers.task_changed.sync_task_or_view_to_projects')
+        patch('rdmo.projects.handlers.task_changed.enqueue_sync_task_or_view_to_projects')
     ):
         yield
 
@@ -15,7 +15,7 @@ def _suppress_project_view_sync():
     """Silence automatic project/view sync during test setup."""
     with (
         patch('rdmo.projects.sync.sync_task_or_view_to_projects'),
-        patch('rdmo.projects.handlers.view_changed.sync_task_or_view_to_projects')
+        patch('rdmo.projects.handlers.view_changed.enqueue_sync_task_or_view_to_projects')
     ):
         yield
 
@@ -1,13 +1,22 @@
 import pytest
 
 from django.core.management import call_command
+from django.utils.timezone import now
 
+from rdmo.projects.models import Project
+from rdmo.projects.sync import (
+    compute_projects_for_tasks_or_views,
+    filter_projects_for_task_or_view,
+    sync_tasks_or_views_to_projects,
+)
 from rdmo.projects.tests.helpers.sync.arrange_project_tasks import arrange_projects_catalogs_and_tasks
 from rdmo.projects.tests.helpers.sync.arrange_project_views import arrange_projects_catalogs_and_views
 from rdmo.projects.tests.helpers.sync.assert_cli_output import assert_sync_projects_show_has_output
 from rdmo.projects.tests.helpers.sync.assert_project_views_or_tasks import (
     assert_all_projects_are_synced_with_instance_m2m_field,
 )
+from rdmo.tasks.models import Task
+from rdmo.views.models import View
 
 PROJECT_SHOW_TEMPLATE = 'Project "{}" [id={}]:'
 
@@ -119,3 +128,85 @@ def test_command_sync_projects_for_tasks_and_views_with_show(settings, capsys):
     # === Assert: show output includes all project/task/view
     out_lines = capsys.readouterr().out.splitlines()
     assert_sync_projects_show_has_output(out_lines)
+
+
+@pytest.mark.django_db
+def test_command_sync_projects_dry_run(settings, capsys):
+    settings.PROJECT_TASKS_SYNC = True
+
+    P, _, T = arrange_projects_catalogs_and_tasks()
+
+    P[1].tasks.set([T[1], T[2], T[3]])
+    P[2].tasks.clear()
+    P[3].tasks.set([T[2]])
+
+    call_command('sync_projects', '--tasks', '--dry-run')
+
+    # nothing was changed, but the changes are reported
+    assert set(P[1].tasks.all()) == {T[1], T[2], T[3]}
+    assert set(P[2].tasks.all()) == set()
+    assert set(P[3].tasks.all()) == {T[2]}
+
+    added, removed = sync_tasks_or_views_to_projects(Task, Task.objects.filter(available=True), dry_run=True)
+    assert added
+    assert removed
+
+    out = capsys.readouterr().out
+    assert f'Would add {len(added)} and remove {len(removed)} project Tasks (dry run).' in out
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('model', [Task, View])
+@pytest.mark.parametrize('multisite', [False, True])
+def test_compute_projects_for_tasks_or_views(settings, model, multisite):
+    settings.MULTISITE = multisite
+
+    # make some instances unavailable, to check the permission rules as well
+    model.objects.filter(id__in=(1, 2)).update(available=False)
+    instances = list(model.objects.all())
+
+    instance_projects = compute_projects_for_tasks_or_views(model, instances)
+
+    for instance in instances:
+        expected = set(filter_projects_for_task_or_view(instance).values_list('id', flat=True))
+        assert instance_projects[instance.id] == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('model', [Task, View])
+def test_sync_tasks_or_views_to_projects(model):
+    field_name = model._meta.model_name + 's'
+    instances = list(model.objects.all())
+
+    # clear the projects and add the wrong ones
+    for project in Project.objects.all():
+        getattr(project, field_name).set([instance for instance in instances if instance.id % 2 == project.id % 2])
+
+    sync_tasks_or_views_to_projects(model, instances)
+
+    for instance in instances:
+        expected = set(filter_projects_for_task_or_view(instance).values_list('id', flat=True))
+        assert set(instance.projects.values_list('id', flat=True)) == expected
+
+    # a second run does not change anything
+    assert sync_tasks_or_views_to_projects(model, instances) == ([], [])
+
+
+@pytest.mark.performance
+@pytest.mark.django_db
+def test_sync_tasks_or_views_to_projects_queries(settings, django_assert_max_num_queries):
+    settings.PROJECT_SYNC_BATCH_SIZE = 1000
+
+    catalog = Project.objects.first().catalog
+    Project.objects.bulk_create([
+        Project(title=f'project{i}', catalog=catalog, site_id=1, created=now(), updated=now(),
+                lft=0, rght=0, tree_id=0, level=0)
+        for i in range(200)
+    ])
+    tasks = list(Task.objects.all())
+
+    # the number of queries does not depend on the number of projects or tasks
+    with django_assert_max_num_queries(12):
+        added, _removed = sync_tasks_or_views_to_projects(Task, tasks)
+
+    assert len(added) > 200
@@ -4,6 +4,7 @@ import pytest
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db.models import F
 
 from rdmo.projects.models import Project
 
@@ -75,3 +76,16 @@ def test_prune_projects_remove(db, settings):
 
     assert stdout.getvalue() == "No projects without ['owner']\n"
     assert not stderr.getvalue()
+
+
+def test_update_projects_last_changed(db):
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    last_changed = dict(Project.objects.values_list('id', 'last_changed'))
+    Project.objects.update(last_changed=F('created'))
+
+    call_command('update_projects_last_changed', stdout=stdout, stderr=stderr)
+
+    assert stdout.getvalue() == f'Updated last_changed for {len(last_changed)} projects.\n'
+    assert dict(Project.objects.values_list('id', 'last_changed')) == last_changed
+
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rdmo.projects.models import Membership, Project
+from rdmo.projects.search import get_search_index
+
+project_id = 1
+user_id = 5
+
+
+def search_projects(search):
+    search_index = get_search_index(Project, 'search_document')
+    return set(Project.objects.filter(search_index.get_filter(search)).values_list('id', flat=True))
+
+
+def test_search_document(db):
+    project = Project.objects.get(id=project_id)
+    assert project.search_document == 'Test\nThis is a test!\nowner Olga Owner owner@example.com'
+
+
+def test_project_save_title(db):
+    project = Project.objects.get(id=project_id)
+    project.title = 'Changed title'
+    project.save()
+
+    assert Project.objects.get(id=project_id).search_document.startswith('Changed title\n')
+    assert search_projects('Changed title') == {project_id}
+
+
+def test_project_save_description(db):
+    project = Project.objects.get(id=project_id)
+    project.description = 'A changed\ndescription'
+    project.save()
+
+    assert Project.objects.get(id=project_id).search_document.split('\n')[1] == 'A changed description'
+    assert search_projects('changed description') == {project_id}
+
+
+def test_project_save_unchanged(db):
+    project = Project.objects.get(id=project_id)
+
+    # the search document is not computed again, if the title and the description did not change
+    with CaptureQueriesContext(connection) as context:
+        project.save(update_fields=['updated'])
+
+    assert not any('SET "search_document"' in query['sql'] for query in context.captured_queries)
+
+
+def test_project_delete(db):
+    Project.objects.get(id=project_id).delete()
+
+    assert project_id not in search_projects('Olga')
+
+
+def test_membership_save(db):
+    Membership.objects.create(project_id=project_id, user=User.objects.get(username='other'), role='owner')
+
+    assert 'Olivia' in Project.objects.get(id=project_id).search_document
+    assert search_projects('Olivia') == {project_id}
+
+
+def test_membership_save_role(db):
+    Membership.objects.create(project_id=project_id, user=User.objects.get(username='other'), role='guest')
+
+    # only owners are part of the search document
+    assert 'Olivia' not in Project.objects.get(id=project_id).search_document
+    assert search_projects('Olivia') == set()
+
+
+def test_membership_delete(db):
+    Membership.objects.filter(project_id=project_id, user_id=user_id).get().delete()
+
+    assert 'Olga' not in Project.objects.get(id=project_id).search_document
+    assert project_id not in search_projects('Olga')
+
+
+def test_user_save_name(db):
+    user = User.objects.get(id=user_id)
+    user.first_name = 'Orla'
+    user.save()
+
+    project_ids = set(Membership.objects.filter(user=user, role='owner').values_list('project_id', flat=True))
+    assert search_projects('Orla') == project_ids
+    assert search_projects('Olga') == set()
+
+
+def test_user_save_last_login(db):
+    user = User.objects.get(id=user_id)
+
+    # the update of last_login on login does not touch the search documents
+    with CaptureQueriesContext(connection) as context:
+        user.save(update_fields=['last_login'])
+
+    assert not any('SET "search_document"' in query['sql'] for query in context.captured_queries)
@@ -0,0 +1,51 @@
+from rdmo.projects.models import Project, Snapshot, Value
+
+project_id = 1
+snapshot_id = 1
+
+
+def test_value_save_last_changed(db):
+    value = Value.objects.filter(project_id=project_id, snapshot=None).first()
+    value.text = 'changed'
+    value.save()
+
+    project = Project.objects.get(id=project_id)
+    assert project.last_changed == value.updated
+
+
+def test_snapshot_value_save_last_changed(db):
+    project = Project.objects.get(id=project_id)
+
+    value = Value.objects.filter(project_id=project_id, snapshot_id=snapshot_id).first()
+    value.text = 'changed'
+    value.save()
+
+    assert Project.objects.get(id=project_id).last_changed == project.last_changed
+
+
+def test_value_delete_last_changed(db):
+    project = Project.objects.get(id=project_id)
+
+    Value.objects.filter(project_id=project_id, snapshot=None).first().delete()
+
+    assert Project.objects.get(id=project_id).last_changed > project.last_changed
+
+
+def test_snapshot_rollback_last_changed(db, files):
+    project = Project.objects.get(id=project_id)
+    snapshot = Snapshot.objects.get(id=snapshot_id)
+    snapshot_values = set(snapshot.values.values_list('id', flat=True))
+
+    snapshot.rollback()
+
+    assert set(project.values.filter(snapshot=None).values_list('id', flat=True)) == snapshot_values
+    assert Project.objects.get(id=project_id).last_changed > project.last_changed
+
+
+def test_project_save_last_changed(db):
+    project = Project.objects.get(id=project_id)
+    last_changed = project.last_changed
+
+    project.save()
+
+    assert Project.objects.get(id=project_id).last_changed > last_changed
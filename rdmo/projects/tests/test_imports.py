@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from django.contrib.auth.models import User
+
+from rdmo.domain.models import Attribute
+from rdmo.options.models import Option
+
+from ..imports import RDMOXMLImport
+
+
+def test_rdmo_xml_import_lookups(db, rf, settings):
+    xml_file = Path(settings.BASE_DIR) / 'xml' / 'project.xml'
+
+    request = rf.get('/')
+    request.user = User.objects.get(username='owner')
+
+    import_plugin = RDMOXMLImport('xml', 'RDMO XML', 'rdmo.projects.imports.RDMOXMLImport')
+    import_plugin.request = request
+    import_plugin.file_name = str(xml_file)
+
+    # the plugin does not load any elements when it is instantiated or checked
+    assert import_plugin.check()
+    assert import_plugin._attributes == {}
+    assert import_plugin._options == {}
+
+    import_plugin.process()
+
+    # only the elements used in the file are loaded
+    assert set(import_plugin._attributes) == import_plugin.get_uris('attribute')
+    assert set(import_plugin._options) == import_plugin.get_uris('option')
+    assert len(import_plugin._attributes) < Attribute.objects.count()
+    assert len(import_plugin._options) < Option.objects.count()
+
+    for value in import_plugin.values:
+        assert value.attribute is not None
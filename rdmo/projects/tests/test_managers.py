@@ -0,0 +1,77 @@
+import pytest
+
+from django.contrib.auth.models import User
+
+from ..models import Membership, Project, Visibility
+
+users = (
+    'owner',
+    'manager',
+    'author',
+    'guest',
+    'user',
+    'site',
+    'example-reviewer',
+)
+
+
+def create_tree(parent, depth, width):
+    if depth > 0:
+        for i in range(width):
+            project = Project.objects.create(title=f'{parent.title}.{i}', parent=parent, catalog=parent.catalog)
+            create_tree(project, depth - 1, width)
+
+
+def get_expected_projects(user):
+    # the projects of the user and all their descendants, computed project by project
+    expected = set()
+    for project in Project.objects.filter(memberships__user=user):
+        expected.update(project.get_descendants(include_self=True).values_list('id', flat=True))
+    return expected
+
+
+@pytest.mark.parametrize('username', users)
+def test_project_filter_user(db, username):
+    user = User.objects.get(username=username)
+
+    projects = Project.objects.filter_user(user, filter_for_user=True)
+    project_ids = list(projects.values_list('id', flat=True))
+
+    assert len(project_ids) == len(set(project_ids))
+    for project in projects:
+        for descendant in project.get_descendants():
+            assert descendant.id in project_ids
+
+
+@pytest.mark.performance
+def test_project_filter_user_queries(db, django_assert_num_queries):
+    user = User.objects.get(username='user')
+    catalog = Project.objects.first().catalog
+
+    # only consider projects where the user is a member
+    Visibility.objects.all().delete()
+
+    # create wide project trees, the user is a member of every root project
+    for i in range(10):
+        root = Project.objects.create(title=f'root{i}', catalog=catalog)
+        Membership.objects.create(project=root, user=user, role='author')
+        create_tree(root, depth=3, width=3)
+
+    # create a deep project tree, the user is a member of a project in the middle
+    parent = Project.objects.create(title='deep', catalog=catalog)
+    for i in range(20):
+        parent = Project.objects.create(title=f'deep{i}', parent=parent, catalog=catalog)
+        if i == 10:
+            Membership.objects.create(project=parent, user=user, role='guest')
+
+    expected = get_expected_projects(user)
+
+    # warm up the permission cache and the user role, the check if the user is a site manager
+    # needs one query, the projects, including all descendants, are fetched using another one
+    Project.objects.filter_user(user, filter_for_user=True)
+
+    with django_assert_num_queries(2):
+        project_ids = list(Project.objects.filter_user(user, filter_for_user=True).values_list('id', flat=True))
+
+    assert len(project_ids) == len(expected) >= 10 * (1 + 3 + 9 + 27) + 10
+    assert set(project_ids) == expected
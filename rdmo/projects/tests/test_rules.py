@@ -0,0 +1,117 @@
+import pytest
+
+from django.contrib.auth.models import User
+
+from ..models import Membership, Project
+from ..rules import (
+    is_current_project_member,
+    is_project_author,
+    is_project_guest,
+    is_project_manager,
+    is_project_member,
+    is_project_owner,
+)
+
+users = (
+    'owner',
+    'manager',
+    'author',
+    'guest',
+    'user',
+    'other'
+)
+
+roles = ('owner', 'manager', 'author', 'guest')
+
+role_predicates = {
+    'owner': is_project_owner,
+    'manager': is_project_manager,
+    'author': is_project_author,
+    'guest': is_project_guest
+}
+
+
+def get_roles(user, projects):
+    # the roles of the user, computed by walking the memberships of the given projects
+    return {membership.role for project in projects for membership in project.memberships.all()
+            if membership.user == user}
+
+
+@pytest.mark.parametrize('username', users)
+def test_project_predicates(db, username):
+    user = User.objects.get(username=username)
+
+    for project in Project.objects.all():
+        current_roles = get_roles(user, [project])
+        inherited_roles = get_roles(user, project.get_ancestors(include_self=True))
+
+        assert is_current_project_member(user, project) == bool(current_roles)
+        assert is_project_member(user, project) == bool(inherited_roles)
+        for role, predicate in role_predicates.items():
+            assert predicate(user, project) == (role in inherited_roles)
+
+
+@pytest.mark.parametrize('role', roles)
+def test_project_predicates_child(db, role):
+    user = User.objects.get(username='other')
+    parent = Project.objects.create(title='parent', catalog_id=1)
+    child = Project.objects.create(title='child', parent=parent, catalog_id=1)
+    Membership.objects.create(project=parent, user=user, role=role)
+
+    user = User.objects.get(username='other')
+    parent = Project.objects.get(id=parent.id)
+    child = Project.objects.get(id=child.id)
+
+    # the roles of the parent are inherited by the child, but the user is not a member of the child itself
+    assert is_current_project_member(user, parent)
+    assert not is_current_project_member(user, child)
+    for project in (parent, child):
+        assert is_project_member(user, project)
+        for predicate_role, predicate in role_predicates.items():
+            assert predicate(user, project) == (predicate_role == role)
+
+
+@pytest.mark.performance
+def test_project_predicates_queries(db, django_assert_num_queries):
+    user = User.objects.get(username='other')
+
+    parent = Project.objects.create(title='root', catalog_id=1)
+    Membership.objects.create(project=parent, user=user, role='guest')
+    for i in range(10):
+        parent = Project.objects.create(title=f'project{i}', parent=parent, catalog_id=1)
+        if i == 5:
+            Membership.objects.create(project=parent, user=user, role='author')
+
+    user = User.objects.get(username='other')
+    projects = list(parent.get_ancestors(include_self=True))
+
+    # the roles of the whole ancestor chain are fetched using one query
+    with django_assert_num_queries(1):
+        assert is_project_member(user, parent)
+
+    # all predicates for the project and its ancestors use the cache
+    with django_assert_num_queries(0):
+        for project in projects:
+            assert is_project_member(user, project)
+            assert is_project_guest(user, project)
+            assert not is_project_owner(user, project)
+        assert is_project_author(user, parent)
+
+
+def test_project_predicates_membership_changed(db):
+    user = User.objects.get(username='other')
+    project = Project.objects.get(id=1)
+
+    assert not is_project_owner(user, project)
+
+    # the cache on the same user object is invalidated by the membership handlers
+    membership = Membership.objects.create(project=project, user=user, role='owner')
+    assert is_project_owner(user, project)
+
+    membership.role = 'guest'
+    membership.save()
+    assert not is_project_owner(user, project)
+    assert is_project_guest(user, project)
+
+    membership.delete()
+    assert not is_project_member(user, project)
@@ -0,0 +1,83 @@
+import pytest
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from rdmo.projects.models import Membership
+from rdmo.projects.sync import sync_task_or_view_to_projects, sync_tasks_or_views_for_project
+from rdmo.projects.tests.helpers.sync.arrange_project_tasks import arrange_projects_catalogs_and_tasks
+from rdmo.tasks.models import Task
+from rdmo.views.models import View
+
+
+@pytest.fixture
+def sync_queue(settings):
+    settings.PROJECT_TASKS_SYNC = True
+    settings.PROJECT_VIEWS_SYNC = True
+
+    P, C, T = arrange_projects_catalogs_and_tasks()
+
+    settings.PROJECT_SYNC_QUEUE = True
+    return P, C, T
+
+
+def test_sync_queue_task(db, mocker, django_capture_on_commit_callbacks, sync_queue):
+    P, C, T = sync_queue
+    sync_mock = mocker.patch('rdmo.projects.sync.sync_task_or_view_to_projects', wraps=sync_task_or_view_to_projects)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        # change the task like the admin does, using several m2m changes
+        T[1].save()
+        T[1].catalogs.remove(C[1])
+        T[1].catalogs.add(C[2])
+        T[1].sites.clear()
+
+        # nothing was synchronized yet
+        assert set(P[1].tasks.all()) == {T[1]}
+        assert set(P[2].tasks.all()) == {T[2]}
+        sync_mock.assert_not_called()
+
+    # the task is synchronized once, on commit
+    assert len(callbacks) == 1
+    sync_mock.assert_called_once_with(T[1])
+
+    assert set(P[1].tasks.all()) == set()
+    assert set(P[2].tasks.all()) == {T[1], T[2]}
+    assert set(P[3].tasks.all()) == {T[3]}
+
+
+def test_sync_queue_membership(db, mocker, django_capture_on_commit_callbacks, sync_queue):
+    P, _C, _T = sync_queue
+    sync_mock = mocker.patch('rdmo.projects.sync.sync_tasks_or_views_for_project',
+                             wraps=sync_tasks_or_views_for_project)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for username in ('author', 'guest', 'editor'):
+            Membership.objects.create(project=P[1], user=User.objects.get(username=username), role='guest')
+
+    # the tasks and the views of the project are synchronized once
+    assert sync_mock.call_count == 2
+    assert {call.args for call in sync_mock.call_args_list} == {(Task, P[1]), (View, P[1])}
+
+
+def test_sync_queue_rollback(db, mocker, django_capture_on_commit_callbacks, sync_queue):
+    P, C, T = sync_queue
+    sync_mock = mocker.patch('rdmo.projects.sync.sync_task_or_view_to_projects', wraps=sync_task_or_view_to_projects)
+
+    def change_task():
+        with transaction.atomic():
+            T[1].catalogs.set([C[2]])
+            raise RuntimeError
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError):
+            change_task()
+
+        # the queue of the rolled back transaction is discarded
+        T[2].save()
+
+    assert len(callbacks) == 1
+    sync_mock.assert_called_once_with(T[2])
+
+    assert set(P[1].tasks.all()) == {T[1]}
+    assert set(P[2].tasks.all()) == {T[2]}
@@ -1,17 +1,22 @@
+from pathlib import Path
+
 import pytest
 
 from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
+from django.core.files.base import ContentFile
 from django.http import QueryDict
 
 from rdmo.core.tests.utils import compute_checksum
 
 from ..filters import ProjectFilter
-from ..models import Invite, Project, Value
+from ..models import Invite, Project, Snapshot, Value
 from ..utils import (
     compute_set_prefix_from_set_value,
     copy_project,
     get_invite_email_project_path,
+    save_import_snapshot_values,
+    save_import_values,
     set_context_querystring_with_filter_and_page,
 )
 
@@ -147,6 +152,156 @@ def test_copy_project(db, files):
                 assert not value.file
 
 
+def get_import_value(value, **kwargs):
+    # create an unsaved value, like the import plugins do, at the position of the given value
+    import_value = Value(
+        attribute=value.attribute,
+        set_prefix=value.set_prefix,
+        set_index=value.set_index,
+        collection_index=value.collection_index,
+        text=value.text,
+        option=value.option,
+        value_type=value.value_type,
+        unit=value.unit
+    )
+    import_value.file_import = None
+    for key, field_value in kwargs.items():
+        setattr(import_value, key, field_value)
+    return import_value
+
+
+def get_value_key(value, snapshot_index=None):
+    if snapshot_index is None:
+        return f'{value.attribute.uri}[{value.set_prefix}][{value.set_index}][{value.collection_index}]'
+    else:
+        return f'{value.attribute.uri}[{snapshot_index}][{value.set_prefix}][{value.set_index}][{value.collection_index}]'  # noqa: E501
+
+
+def test_save_import_values(db, files, django_capture_on_commit_callbacks):
+    project = Project.objects.get(id=1)
+    project_values = list(project.values.filter(snapshot=None).select_related('attribute', 'option'))
+    file_value = next(value for value in project_values if value.file)
+
+    import_values = []
+    for value in project_values:
+        # update all existing values, and replace the files
+        import_value = get_import_value(value, text=f'{value.text} (imported)', current=value)
+        if value.file:
+            import_value.file_import = {'name': 'imported.txt', 'file': ContentFile(b'imported')}
+        import_values.append(import_value)
+
+    # create a new value with a file and a new value without
+    import_values.append(get_import_value(file_value, collection_index=10, current=None, file_import={
+        'name': 'new.txt', 'file': ContentFile(b'new')
+    }))
+    import_values.append(get_import_value(project_values[0], set_index=10, current=None))
+
+    checked = {get_value_key(import_value) for import_value in import_values}
+    replaced_files = [Path(files) / value.file.name for value in project_values if value.file]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        save_import_values(project, import_values, checked)
+
+    values = project.values.filter(snapshot=None)
+    assert values.count() == len(project_values) + 2
+
+    for value in project_values:
+        value.refresh_from_db()
+        assert value.text.endswith(' (imported)')
+        if value.file:
+            assert value.file.open('rb').read() == b'imported'
+            assert value.file.name.startswith(f'projects/{project.id}/values/{value.id}/')
+
+    new_file_value = values.get(attribute=file_value.attribute, collection_index=10)
+    assert new_file_value.file.open('rb').read() == b'new'
+    assert new_file_value.file.name == f'projects/{project.id}/values/{new_file_value.id}/new.txt'
+    assert values.filter(attribute=project_values[0].attribute, set_index=10).exists()
+
+    # the replaced files were removed after the commit
+    for replaced_file in replaced_files:
+        assert not replaced_file.exists()
+
+
+def test_save_import_values_error(db, files, monkeypatch):
+    project = Project.objects.get(id=1)
+    file_value = project.values.filter(snapshot=None).exclude(file='').select_related('attribute').first()
+    file_name = file_value.file.name
+
+    import_value = get_import_value(file_value, current=file_value, file_import={
+        'name': 'imported.txt', 'file': ContentFile(b'imported')
+    })
+
+    def bulk_update(objs, fields, **kwargs):
+        if 'file' in fields:
+            raise RuntimeError
+        return bulk_update_original(objs, fields, **kwargs)
+
+    bulk_update_original = Value.objects.bulk_update
+    monkeypatch.setattr(Value.objects, 'bulk_update', bulk_update)
+
+    with pytest.raises(RuntimeError):
+        save_import_values(project, [import_value], {get_value_key(import_value)})
+
+    # the new file was removed again, the original file is kept
+    assert Value.objects.get(id=file_value.id).file.name == file_name
+    assert (Path(files) / file_name).exists()
+    assert sorted(path.name for path in (Path(files) / file_name).parent.iterdir()) == [Path(file_name).name]
+
+
+def test_save_import_values_unchecked(db, files):
+    project = Project.objects.get(id=1)
+    project_values = list(project.values.filter(snapshot=None).select_related('attribute', 'option'))
+
+    import_values = [
+        get_import_value(value, text='imported', current=value, file_import={
+            'name': 'imported.txt', 'file': ContentFile(b'imported')
+        }) for value in project_values
+    ]
+    media_files = sorted(Path(files).rglob('*'))
+
+    # without any checked value, nothing is stored (as when only the preview was shown)
+    save_import_values(project, import_values, set())
+
+    assert list(project.values.filter(snapshot=None).values_list('id', 'text', 'file')) == \
+        [(value.id, value.text, value.file.name or '') for value in project_values]
+    assert sorted(Path(files).rglob('*')) == media_files
+
+
+def test_save_import_snapshot_values(db, files):
+    project = Project.objects.get(id=1)
+    snapshot = project.snapshots.get(id=7)
+    snapshot_values = list(snapshot.values.select_related('attribute', 'option'))
+
+    import_project = Project.objects.create(title='import', catalog=project.catalog)
+    import_snapshot = Snapshot(title=snapshot.title, description=snapshot.description)
+    import_snapshot.snapshot_index = 0
+    import_snapshot.snapshot_values = [
+        # the files are copied from the values of the original snapshot
+        get_import_value(value, file=value.file.name or None) for value in snapshot_values
+    ]
+    checked = {get_value_key(value, 0) for value in import_snapshot.snapshot_values}
+
+    save_import_snapshot_values(import_project, [import_snapshot], checked)
+
+    assert import_snapshot.pk is not None
+    assert import_snapshot.values.count() == len(snapshot_values)
+
+    for value in snapshot_values:
+        import_value = import_snapshot.values.get(attribute=value.attribute, set_prefix=value.set_prefix,
+                                                  set_index=value.set_index, collection_index=value.collection_index)
+        assert import_value.project == import_project
+        assert import_value.text == value.text
+
+        if value.file:
+            assert import_value.file.name == \
+                f'projects/{import_project.id}/snapshots/{import_snapshot.id}/values/{import_value.id}/{value.file_name}'
+            assert compute_checksum(import_value.file.open('rb').read()) == \
+                   compute_checksum(value.file.open('rb').read())
+            assert (Path(files) / value.file.name).exists()
+        else:
+            assert not import_value.file
+
+
 @pytest.mark.parametrize('set_value, value, result', SET_VALUES)
 def test_compute_set_prefix_from_set_value(set_value, value, result):
     assert compute_set_prefix_from_set_value(Value(**set_value), Value(**value)) == result
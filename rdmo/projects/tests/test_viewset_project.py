@@ -108,6 +108,31 @@ def test_list(db, client, username, password):
         assert response.status_code == 401
 
 
+@pytest.mark.parametrize('ordering', ['id', '-id', 'updated', '-last_changed'])
+def test_list_cursor(db, client, ordering):
+    client.login(username='owner', password='owner')
+
+    url = reverse(urlnames['list']) + f'?cursor=&ordering={ordering}'
+
+    project_ids = []
+    while url:
+        response = client.get(url)
+        response_data = response.json()
+
+        assert response.status_code == 200
+        assert 'count' not in response_data
+        assert len(response_data['results']) <= page_size
+
+        project_ids += [item['id'] for item in response_data['results']]
+        url = response_data['next']
+
+    id_ordering = '-id' if ordering.startswith('-') else 'id'
+    values_list = Project.objects.filter(id__in=view_project_permission_map.get('owner', [])) \
+                                 .order_by(*dict.fromkeys((ordering, id_ordering))) \
+                                 .values_list('id', flat=True)
+    assert project_ids == list(values_list)
+
+
 @pytest.mark.parametrize('username,password', users)
 def test_list_user(db, client, username, password):
     client.login(username=username, password=password)
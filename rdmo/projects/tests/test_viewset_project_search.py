@@ -0,0 +1,80 @@
+import pytest
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.urls import reverse
+
+from ..models import Membership, Project
+
+urlnames = {
+    'list': 'v1-projects:project-list'
+}
+
+searches = (
+    'Test',
+    'child1',
+    'ipsum dolor',
+    'Olga',
+    'owner@example',
+    'Prune Test',
+    'Ow'
+)
+
+
+@pytest.mark.parametrize('search', searches)
+def test_list_search(db, client, search):
+    client.login(username='admin', password='admin')
+
+    url = reverse(urlnames['list']) + f'?search={search}'
+
+    project_ids = []
+    while url:
+        response = client.get(url)
+        response_data = response.json()
+
+        assert response.status_code == 200
+
+        project_ids += [item['id'] for item in response_data['results']]
+        url = response_data['next']
+
+    # the same projects as with the former search over the joined owners, and the description
+    queryset = Project.objects.all()
+    for search_term in search.split():
+        queryset = queryset.filter(
+            Q(title__icontains=search_term) |
+            Q(description__icontains=search_term) | (
+                Q(memberships__role='owner') & (
+                    Q(memberships__user__username__icontains=search_term) |
+                    Q(memberships__user__first_name__icontains=search_term) |
+                    Q(memberships__user__last_name__icontains=search_term) |
+                    Q(memberships__user__email__icontains=search_term)
+                )
+            )
+        )
+    assert sorted(project_ids) == sorted(set(queryset.values_list('id', flat=True)))
+
+
+def test_list_search_rank(db, client):
+    client.login(username='owner', password='owner')
+
+    owner = User.objects.get(username='owner')
+    for title, description in (
+        ('Other project', 'This project mentions the zebra only once.'),
+        ('Zebra project', 'A project about the zebra, the zebra crossing and more zebras.'),
+    ):
+        project = Project.objects.create(title=title, description=description, catalog_id=1)
+        Membership.objects.create(project=project, user=owner, role='owner')
+
+    url = reverse(urlnames['list']) + '?search=zebra'
+    response = client.get(url)
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert [item['title'] for item in response_data['results']] == ['Zebra project', 'Other project']
+
+    url = reverse(urlnames['list']) + '?search=zebra&ordering=title'
+    response = client.get(url)
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert [item['title'] for item in response_data['results']] == ['Other project', 'Zebra project']
@@ -95,6 +95,37 @@ def test_list_snapshot(db, client, username, password, snapshot_id):
         assert response.status_code == 401
 
 
+@pytest.mark.parametrize('username,password', users)
+def test_list_cursor(db, client, username, password):
+    client.login(username=username, password=password)
+
+    url = reverse(urlnames['list']) + '?cursor=&ordering=updated&page_size=10'
+    response = client.get(url)
+
+    if password:
+        value_ids = []
+        while url:
+            response = client.get(url)
+            response_data = response.json()
+
+            assert response.status_code == 200
+            assert 'count' not in response_data
+            assert len(response_data['results']) <= 10
+
+            value_ids += [item['id'] for item in response_data['results']]
+            url = response_data['next']
+
+        if username == 'user':
+            assert value_ids == values_visible
+        else:
+            values_list = Value.objects.filter(project__in=view_value_permission_map.get(username, [])) \
+                                       .filter(snapshot_id=None) \
+                                       .order_by('updated', 'id').values_list('id', flat=True)
+            assert value_ids == list(values_list)
+    else:
+        assert response.status_code == 401
+
+
 @pytest.mark.parametrize('username,password', users)
 @pytest.mark.parametrize('value_id', values)
 def test_detail(db, client, username, password, value_id):
@@ -88,3 +88,40 @@ def test_search_attribute_search_collection(db, client, collection):
                                .filter(attribute_id=attribute_id, text__contains=search) \
                                .exclude_empty().order_by(*Value._meta.ordering)[:10]
     assert sorted([item['id'] for item in response.json()]) == sorted([item.id for item in values_list])
+
+
+def test_search_value_changed(db, client):
+    client.login(username='owner', password='owner')
+
+    # the search index is updated when a value is saved
+    value = Value.objects.filter(project_id=1, snapshot=None).exclude_empty().first()
+    value.text = 'A "quoted" text, which is easy to find'
+    value.save()
+
+    url = reverse(urlnames['search']) + '?search="is easy" QUOTED'
+    response = client.get(url)
+    assert [item['id'] for item in response.json()] == [value.id]
+
+    # and when the value is deleted
+    value.delete()
+
+    response = client.get(url)
+    assert response.json() == []
+
+
+def test_search_collection_sets(db, client, settings):
+    settings.PROJECT_VALUES_SEARCH_LIMIT = 2
+    client.login(username='owner', password='owner')
+
+    url = reverse(urlnames['search']) + f'?attribute={attribute_id}&collection=true'
+    response = client.get(url)
+
+    fields = ('project_id', 'snapshot_id', 'attribute_id', 'set_prefix', 'set_index')
+    sets = Value.objects.filter(project__in=view_value_permission_map.get('owner', [])) \
+                        .filter(attribute_id=attribute_id, snapshot=None) \
+                        .exclude_empty().values_list(*fields).order_by(*fields).distinct()[:2]
+    values_list = Value.objects.filter(project__in=view_value_permission_map.get('owner', [])) \
+                               .filter(attribute_id=attribute_id, snapshot=None) \
+                               .exclude_empty().values_list('id', *fields)
+    assert sorted([item['id'] for item in response.json()]) == \
+        sorted([value_id for value_id, *value_set in values_list if tuple(value_set) in sets])
@@ -6,6 +6,9 @@ from pathlib import Path
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, router, transaction
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.timezone import now
@@ -14,6 +17,8 @@ from rdmo.core.mail import send_mail
 from rdmo.core.plugins import get_plugins
 from rdmo.core.utils import remove_double_newlines
 
+from .search import get_search_index, get_value_search_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,8 +115,9 @@ def copy_project(instance, site, owners):
         else:
             project_values.append(value)
 
-    # insert the new values using bulk_create
+    # insert the new values using bulk_create, the search index is not updated by signals here
     Value.objects.bulk_create(project_values)
+    get_value_search_index(router.db_for_write(Value)).store(project_values)
 
     # save project snapshots
     for snapshot, snapshot_values in snapshots.items():
@@ -134,6 +140,7 @@ def copy_project(instance, site, owners):
 
         # insert the new snapshot values using bulk_create
         Value.objects.bulk_create(project_snapshot_values)
+        get_value_search_index(router.db_for_write(Value)).store(project_snapshot_values)
 
     for owner in owners:
         membership = Membership(project=project, user=owner, role='owner')
@@ -143,6 +150,10 @@ def copy_project(instance, site, owners):
 
 
 def save_import_values(project, values, checked):
+    new_values = []
+    updated_values = []
+    file_values = []
+
     for value in values:
         if value.attribute:
             value_key = f'{value.attribute.uri}[{value.set_prefix}][{value.set_index}][{value.collection_index}]'
@@ -154,17 +165,8 @@ def save_import_values(project, values, checked):
                     assert value.pk is None
 
                     value.project = project
-                    value.save()
-
-                    if value.file:
-                        value.copy_file(value.file_name, value.file)
-                    else:
-                        try:
-                            name = value.file_import.get('name')
-                            file = value.file_import.get('file')
-                            value.file.save(name, file)
-                        except AttributeError:
-                            pass
+                    new_values.append(value)
+                    file_values.append((value, value))
 
                 else:
                     # make sure we have the correct value
@@ -177,54 +179,176 @@ def save_import_values(project, values, checked):
                     # assert that this is an new value
                     assert current_value.pk is not None
 
+                    current_value.project = project
                     current_value.text = value.text
                     current_value.option = value.option
                     current_value.value_type = value.value_type
                     current_value.unit = value.unit
-                    current_value.save()
+                    updated_values.append(current_value)
+                    file_values.append((current_value, value))
 
-                    if value.file:
-                        current_value.file.delete()
-                        current_value.copy_file(value.file_name, value.file)
-                    else:
-                        try:
-                            name = value.file_import.get('name')
-                            file = value.file_import.get('file')
-                            current_value.file.delete()
-                            current_value.file.save(name, file)
-                        except AttributeError:
-                            pass
+    with transaction.atomic():
+        store_import_values(new_values, updated_values)
+        store_import_files(file_values)
 
 
 def save_import_snapshot_values(project, snapshots, checked):
-    for snapshot in snapshots:
-        # assert that this is a new snapshot
-        assert snapshot.pk is None
+    new_values = []
+    file_values = []
 
-        snapshot.project = project
-        snapshot.save(copy_values=False)
+    with transaction.atomic():
+        for snapshot in snapshots:
+            # assert that this is a new snapshot
+            assert snapshot.pk is None
 
-        for value in snapshot.snapshot_values:
-            if value.attribute:
-                value_key = f"{value.attribute.uri}[{snapshot.snapshot_index}][{value.set_prefix}][{value.set_index}][{value.collection_index}]" # noqa: E501
+            snapshot.project = project
+            snapshot.save(copy_values=False)
 
-                if value_key in checked:
-                    # assert that this is a new value
-                    assert value.pk is None
+            for value in snapshot.snapshot_values:
+                if value.attribute:
+                    value_key = f"{value.attribute.uri}[{snapshot.snapshot_index}][{value.set_prefix}][{value.set_index}][{value.collection_index}]" # noqa: E501
 
-                    value.project = project
-                    value.snapshot = snapshot
-                    value.save()
-
-                    if value.file:
-                        value.copy_file(value.file_name, value.file)
-                    else:
-                        try:
-                            name = value.file_import.get('name')
-                            file = value.file_import.get('file')
-                            value.file.save(name, file)
-                        except AttributeError:
-                            pass
+                    if value_key in checked:
+                        # assert that this is a new value
+                        assert value.pk is None
+
+                        value.project = project
+                        value.snapshot = snapshot
+                        new_values.append(value)
+                        file_values.append((value, value))
+
+        store_import_values(new_values, [])
+        store_import_files(file_values)
+
+
+def store_last_changed(project_ids, timestamp=None):
+    # the last_changed field of the projects is updated using one query,
+    # e.g. after values were created or deleted without Value.save or Value.delete
+    from .models import Project  # to prevent circular inclusion
+
+    if timestamp is None:
+        timestamp = now()
+
+    Project.objects.filter(id__in=project_ids) \
+                   .filter(last_changed__lt=timestamp) \
+                   .update(last_changed=timestamp)
+
+
+def compute_last_changed(queryset):
+    # compute the last_changed field from the updated fields of the projects and their values
+    from .models import Value  # to prevent circular inclusion
+
+    last_changed_subquery = Subquery(
+        Value.objects.filter(project=OuterRef('pk')).order_by('-updated').values('updated')[:1]
+    )
+    # Greatest returns null for projects without values, Coalesce then falls back to 'updated'
+    return queryset.update(last_changed=Coalesce(Greatest(last_changed_subquery, 'updated'), 'updated'))
+
+
+def compute_search_document(project, owners=()):
+    # the search document contains one line for the title, the description and the owners of a project,
+    # so that the handlers can check if the title or the description have changed without a query
+    owner_words = [
+        word for owner in owners
+        for word in (owner.username, owner.first_name, owner.last_name, owner.email) if word
+    ]
+    return '\n'.join([project.title, ' '.join(project.description.split()), ' '.join(owner_words)])
+
+
+def store_search_documents(project_ids, using=None):
+    # compute the search documents for the given projects, store them and update the search index
+    from .models import Membership, Project  # to prevent circular inclusion
+
+    using = using or router.db_for_write(Project)
+
+    owners = defaultdict(list)
+    memberships = Membership.objects.using(using).filter(project__in=project_ids, role='owner').select_related('user')
+    for membership in memberships:
+        owners[membership.project_id].append(membership.user)
+
+    projects = list(Project.objects.using(using).filter(id__in=project_ids).only('id', 'title', 'description'))
+    for project in projects:
+        project.search_document = compute_search_document(project, owners[project.id])
+
+    Project.objects.using(using).bulk_update(projects, ('search_document', ))
+    get_search_index(Project, 'search_document', using).store(projects)
+
+
+def store_import_values(new_values, updated_values):
+    from .models import Value  # to prevent circular inclusion
+
+    # the values are stored using bulk_create and bulk_update, therefore
+    # Value.save is not called and the timestamps need to be set here
+    timestamp = now()
+    for value in new_values:
+        if value.created is None:
+            value.created = timestamp
+        value.updated = timestamp
+
+    for value in updated_values:
+        value.updated = timestamp
+
+    if connection.features.can_return_rows_from_bulk_insert:
+        Value.objects.bulk_create(new_values, batch_size=settings.PROJECT_IMPORTS_BATCH_SIZE)
+    else:
+        # the primary keys are needed for the file paths, but are not returned by bulk_create (e.g. for MySQL)
+        for value in new_values:
+            value.save()
+
+    Value.objects.bulk_update(updated_values, ('text', 'option', 'value_type', 'unit', 'updated'),
+                              batch_size=settings.PROJECT_IMPORTS_BATCH_SIZE)
+
+    get_value_search_index(router.db_for_write(Value)).store([*new_values, *updated_values])
+    store_last_changed({value.project_id for value in [*new_values, *updated_values]}, timestamp)
+
+
+def store_import_files(file_values):
+    # the files are written to the storage one after another, the file names are then stored using one
+    # bulk_update for all values with files, this needs to be called in the transaction of the import
+    from .models import Value  # to prevent circular inclusion
+
+    file_values = [
+        (value, source) for value, source in file_values
+        if source.file or getattr(source, 'file_import', None)
+    ]
+    if not file_values:
+        return
+
+    stored_files = []
+    replaced_files = []
+    try:
+        for value, source in file_values:
+            if value.file:
+                replaced_files.append((value.file.storage, value.file.name))
+
+            store_import_file(value, source)
+            stored_files.append((value.file.storage, value.file.name))
+
+        Value.objects.bulk_update([value for value, _source in file_values], ('file', ),
+                                  batch_size=settings.PROJECT_IMPORTS_BATCH_SIZE)
+    except Exception:
+        # the values are rolled back with the transaction, so the new files are removed again
+        delete_import_files(stored_files)
+        raise
+
+    # the replaced files are only removed, once the new file names are committed
+    if replaced_files:
+        transaction.on_commit(lambda: delete_import_files(replaced_files))
+
+
+def delete_import_files(files):
+    for storage, name in files:
+        storage.delete(name)
+
+
+def store_import_file(value, source):
+    if source.file:
+        # copy the file from a different value (or from the original value when importing from a project)
+        name, file = source.file_name, source.file
+    else:
+        name, file = source.file_import.get('name'), source.file_import.get('file')
+
+    value.file.save(name, file, save=False)
 
 
 def save_import_tasks(project, tasks):
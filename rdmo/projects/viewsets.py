@@ -3,15 +3,15 @@ from collections import defaultdict
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import OuterRef, Prefetch, Q, Subquery
-from django.db.models.functions import Coalesce, Greatest
+from django.db import router
+from django.db.models import F, OuterRef, Prefetch, Q, Subquery, Window
+from django.db.models.functions import DenseRank
 from django.http import Http404, HttpResponseRedirect
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError
-from rest_framework.filters import SearchFilter
 from rest_framework.mixins import CreateModelMixin, ListModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
@@ -23,6 +23,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework_extensions.mixins import NestedViewSetMixin
 
 from rdmo.conditions.models import Condition
+from rdmo.core.pagination import KeysetPagination, KeysetPaginationMixin
 from rdmo.core.permissions import HasModelPermission
 from rdmo.core.utils import human2bytes, is_truthy, return_file_response
 from rdmo.options.models import OptionSet
@@ -39,6 +40,7 @@ from .filters import (
     ProjectSearchFilterBackend,
     ProjectUserFilterBackend,
     SnapshotFilterBackend,
+    ValueSearchFilterBackend,
 )
 from .models import Continuation, Integration, Invite, Issue, Membership, Project, Snapshot, Value, Visibility
 from .permissions import (
@@ -55,6 +57,7 @@ from .progress import (
     compute_page,
     compute_progress,
 )
+from .search import get_value_search_index
 from .serializers.v1 import (
     IntegrationSerializer,
     InviteSerializer,
@@ -90,6 +93,7 @@ from .utils import (
     get_upload_accept,
     send_contact_message,
     send_invite_email,
+    store_last_changed,
 )
 
 
@@ -97,10 +101,20 @@ class ProjectPagination(PageNumberPagination):
     page_size = settings.PROJECT_TABLE_PAGE_SIZE
 
 
-class ProjectViewSet(ModelViewSet):
+class ProjectKeysetPagination(KeysetPagination):
+    page_size = settings.PROJECT_TABLE_PAGE_SIZE
+
+
+class ValueKeysetPagination(KeysetPagination):
+    page_size = settings.PROJECT_VALUES_PAGE_SIZE
+
+
+class ProjectViewSet(KeysetPaginationMixin, ModelViewSet):
     permission_classes = (HasModelPermission | HasProjectsPermission, )
     serializer_class = ProjectSerializer
     pagination_class = ProjectPagination
+    keyset_pagination_class = ProjectKeysetPagination
+    keyset_ordering_fields = ('id', 'updated', 'last_changed')
 
     filter_backends = (
         DjangoFilterBackend,
@@ -134,15 +148,6 @@ class ProjectViewSet(ModelViewSet):
             Prefetch('memberships', queryset=Membership.objects.select_related('user'), to_attr='memberships_list')
         ).select_related('catalog', 'visibility')
 
-        # prepare subquery for last_changed
-        last_changed_subquery = Subquery(
-            Value.objects.filter(project=OuterRef('pk')).order_by('-updated').values('updated')[:1]
-        )
-        # the 'updated' field from a Project always returns a valid DateTime value
-        # when Greatest returns null, then Coalesce will return the value for 'updated' as a fall-back
-        # when Greatest returns a value, then Coalesce will return this value
-        queryset = queryset.annotate(last_changed=Coalesce(Greatest(last_changed_subquery, 'updated'), 'updated'))
-
         return queryset
 
     @action(detail=False, methods=['GET'], permission_classes=(HasModelPermission | HasProjectsPermission, ))
@@ -716,6 +721,8 @@ class ProjectValueViewSet(ProjectNestedViewSetMixin, ModelViewSet):
 
         # bulk create the new values
         created_values = Value.objects.bulk_create(new_values)
+        get_value_search_index(router.db_for_write(Value)).store(created_values)
+        store_last_changed([self.project.id])
         response_values += [ValueSerializer(instance=value).data for value in created_values]
         response_values += [ValueSerializer(instance=value).data for value in updated_values]
 
@@ -733,6 +740,7 @@ class ProjectValueViewSet(ProjectNestedViewSetMixin, ModelViewSet):
         # collect all values for this set and all descendants and delete them
         values = self.get_queryset().filter_set(set_value)
         values.delete()
+        store_last_changed([self.project.id])
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -916,16 +924,18 @@ class SnapshotViewSet(ReadOnlyModelViewSet):
         return Snapshot.objects.filter_user(self.request.user)
 
 
-class ValueViewSet(ReadOnlyModelViewSet):
+class ValueViewSet(KeysetPaginationMixin, ReadOnlyModelViewSet):
     permission_classes = (HasModelPermission | HasProjectsPermission, )
     serializer_class = ValueSerializer
+    keyset_pagination_class = ValueKeysetPagination
+    keyset_ordering_fields = ('id', 'updated')
 
     filter_backends = (
         AttributeFilterBackend,
         SnapshotFilterBackend,
         OptionFilterBackend,
         DjangoFilterBackend,
-        SearchFilter
+        ValueSearchFilterBackend
     )
     filterset_fields = (
         'project',
@@ -959,26 +969,13 @@ class ValueViewSet(ReadOnlyModelViewSet):
             pass
 
         if is_truthy(request.GET.get('collection')):
-            # if collection is set (for checkboxes), we first select each distinct set and create a Q object with it
-            # by doing so we can select an undetermined number of values which belong to an exact number of sets
-            # given by settings.PROJECT_VALUES_SEARCH_LIMIT
-            #
-            # DISTINCT ON is not available on sqlite so we just apply the limit like for all other questions, this
-            # will display the last set of checked values incomplete
+            # if collection is set (for checkboxes), we rank the distinct sets of the values and select all values
+            # of the first sets, by doing so we can select an undetermined number of values which belong to an
+            # exact number of sets given by settings.PROJECT_VALUES_SEARCH_LIMIT, using one query
             fields = ('project_id', 'snapshot_id', 'attribute_id', 'set_prefix', 'set_index')
-            values_list = (
-                queryset
-                    .values(*fields)
-                    .order_by(*fields)
-                    .distinct()
-                    [:settings.PROJECT_VALUES_SEARCH_LIMIT]
-            )
-
-            q = Q()
-            for values_dict in values_list:
-                q |= Q(**values_dict)
-
-            queryset = queryset.filter(q).order_by(*Value._meta.ordering)
+            queryset = queryset.annotate(set_rank=Window(DenseRank(), order_by=[F(field) for field in fields])) \
+                               .filter(set_rank__lte=settings.PROJECT_VALUES_SEARCH_LIMIT) \
+                               .order_by(*Value._meta.ordering)
         else:
             queryset = queryset.order_by(*Value._meta.ordering)[:settings.PROJECT_VALUES_SEARCH_LIMIT]
 
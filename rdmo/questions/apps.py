@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class QuestionsConfig(AppConfig):
     name = 'rdmo.questions'
     verbose_name = _('Questions')
+
+    def ready(self):
+        from . import handlers  # noqa: F401
@@ -0,0 +1,52 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    Catalog,
+    CatalogElement,
+    CatalogSection,
+    PageQuestion,
+    PageQuestionSet,
+    QuestionSetQuestion,
+    QuestionSetQuestionSet,
+    SectionPage,
+)
+from .utils import fetch_catalog_ids_for_element, store_catalog_elements
+
+
+@receiver(post_save, sender=CatalogSection)
+@receiver(post_delete, sender=CatalogSection)
+def catalog_section_changed(sender, instance, **kwargs):
+    store_catalog_elements([instance.catalog_id])
+
+
+@receiver(post_save, sender=SectionPage)
+@receiver(post_delete, sender=SectionPage)
+def section_page_changed(sender, instance, **kwargs):
+    store_catalog_elements(fetch_catalog_ids_for_element('section', instance.section_id))
+
+
+@receiver(post_save, sender=PageQuestionSet)
+@receiver(post_delete, sender=PageQuestionSet)
+@receiver(post_save, sender=PageQuestion)
+@receiver(post_delete, sender=PageQuestion)
+def page_element_changed(sender, instance, **kwargs):
+    store_catalog_elements(fetch_catalog_ids_for_element('page', instance.page_id))
+
+
+@receiver(post_save, sender=QuestionSetQuestionSet)
+@receiver(post_delete, sender=QuestionSetQuestionSet)
+def questionset_questionset_changed(sender, instance, **kwargs):
+    store_catalog_elements(fetch_catalog_ids_for_element('questionset', instance.parent_id))
+
+
+@receiver(post_save, sender=QuestionSetQuestion)
+@receiver(post_delete, sender=QuestionSetQuestion)
+def questionset_question_changed(sender, instance, **kwargs):
+    store_catalog_elements(fetch_catalog_ids_for_element('questionset', instance.questionset_id))
+
+
+@receiver(post_delete, sender=Catalog)
+def catalog_deleted(sender, instance, **kwargs):
+    # the rows are not deleted by the database, since CatalogElement.catalog has no constraint
+    CatalogElement.objects.filter(catalog_id=instance.id).delete()
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.expressions import RawSQL
 
 from rdmo.core.managers import (
     AvailabilityManagerMixin,
@@ -7,6 +8,8 @@ from rdmo.core.managers import (
     CurrentSiteQuerySetMixin,
     GroupsManagerMixin,
     GroupsQuerySetMixin,
+    LockedManagerMixin,
+    LockedQuerySetMixin,
 )
 
 from .prefetch import (
@@ -18,7 +21,15 @@ from .prefetch import (
 )
 
 
-class CatalogQuerySet(CurrentSiteQuerySetMixin, GroupsQuerySetMixin, AvailabilityQuerySetMixin, models.QuerySet):
+def get_catalog_element_ids(catalog, model):
+    from .models import CatalogElement  # to prevent circular inclusion
+
+    return CatalogElement.objects.filter(catalog=catalog, element_type=model._meta.model_name) \
+                                 .values('element_id')
+
+
+class CatalogQuerySet(CurrentSiteQuerySetMixin, GroupsQuerySetMixin, AvailabilityQuerySetMixin, LockedQuerySetMixin,
+                      models.QuerySet):
 
     def filter_catalog(self, catalog):
         return self.filter(models.Q(catalogs=None) | models.Q(catalogs=catalog))
@@ -35,7 +46,8 @@ class CatalogQuerySet(CurrentSiteQuerySetMixin, GroupsQuerySetMixin, Availabilit
         )
 
 
-class CatalogManager(CurrentSiteManagerMixin, GroupsManagerMixin, AvailabilityManagerMixin, models.Manager):
+class CatalogManager(CurrentSiteManagerMixin, GroupsManagerMixin, AvailabilityManagerMixin, LockedManagerMixin,
+                     models.Manager):
 
     def get_queryset(self):
         return CatalogQuerySet(self.model, using=self._db)
@@ -50,13 +62,20 @@ class CatalogManager(CurrentSiteManagerMixin, GroupsManagerMixin, AvailabilityMa
         return self.get_queryset().filter_for_user(user)
 
 
-class SectionQuerySet(models.QuerySet):
+class SectionQuerySet(LockedQuerySetMixin, models.QuerySet):
 
     def prefetch_elements(self, **kwargs):
         return self.prefetch_related(*get_section_prefetch_lookups(**kwargs))
 
+    def get_locked_filter(self):
+        from .models import CatalogSection  # to prevent circular inclusion
+
+        return models.Q(locked=True) | models.Q(models.Exists(
+            CatalogSection.objects.filter(section=models.OuterRef('pk'), catalog__locked=True)
+        ))
+
 
-class SectionManager(models.Manager):
+class SectionManager(LockedManagerMixin, models.Manager):
 
     def get_queryset(self):
         return SectionQuerySet(self.model, using=self._db)
@@ -65,17 +84,23 @@ class SectionManager(models.Manager):
         return self.get_queryset().prefetch_elements(**kwargs)
 
 
-class PageQuerySet(models.QuerySet):
+class PageQuerySet(LockedQuerySetMixin, models.QuerySet):
 
     def prefetch_elements(self, **kwargs):
         return self.prefetch_related(*get_page_prefetch_lookups(**kwargs))
 
+    def get_locked_filter(self):
+        from .models import Section, SectionPage  # to prevent circular inclusion
+
+        return models.Q(locked=True) | models.Q(models.Exists(
+            SectionPage.objects.filter(page=models.OuterRef('pk'), section__in=Section.objects.filter_locked())
+        ))
+
     def filter_by_catalog(self, catalog):
-        ids = [descendant.id for descendant in catalog.descendants if isinstance(descendant, self.model)]
-        return self.filter(id__in=ids)
+        return self.filter(id__in=get_catalog_element_ids(catalog, self.model))
 
 
-class PageManager(models.Manager):
+class PageManager(LockedManagerMixin, models.Manager):
 
     def get_queryset(self):
         return PageQuerySet(self.model, using=self._db)
@@ -87,17 +112,38 @@ class PageManager(models.Manager):
         return self.get_queryset().prefetch_elements(**kwargs)
 
 
-class QuestionSetQuerySet(models.QuerySet):
+class QuestionSetQuerySet(LockedQuerySetMixin, models.QuerySet):
 
     def prefetch_elements(self, **kwargs):
         return self.prefetch_related(*get_questionset_prefetch_lookups(**kwargs))
 
+    def get_locked_filter(self):
+        from .models import Page, PageQuestionSet, QuestionSetQuestionSet  # to prevent circular inclusion
+
+        # like QuestionSet.is_locked, a question set is locked if it is locked itself, if one of its pages is
+        # locked or if one of its child question sets is locked. The question sets can be nested arbitrarily
+        # deep, therefore a recursive query is used, which starts with the locked question sets and the
+        # question sets of locked pages and adds their parents
+        pages_sql, pages_params = Page.objects.filter_locked().order_by().values('id').query.sql_with_params()
+        questionset_table = self.model._meta.db_table
+        page_questionset_table = PageQuestionSet._meta.db_table
+        questionset_questionset_table = QuestionSetQuestionSet._meta.db_table
+
+        return models.Q(id__in=RawSQL(
+            f'WITH RECURSIVE locked_questionsets (id) AS ('
+            f'SELECT id FROM {questionset_table} WHERE locked = %s '
+            f'UNION SELECT questionset_id FROM {page_questionset_table} WHERE page_id IN ({pages_sql}) '
+            f'UNION SELECT {questionset_questionset_table}.parent_id FROM {questionset_questionset_table} '
+            f'INNER JOIN locked_questionsets ON {questionset_questionset_table}.questionset_id = locked_questionsets.id'
+            f') SELECT id FROM locked_questionsets',
+            (True, *pages_params)
+        ))
+
     def filter_by_catalog(self, catalog):
-        ids = [descendant.id for descendant in catalog.descendants if isinstance(descendant, self.model)]
-        return self.filter(id__in=ids)
+        return self.filter(id__in=get_catalog_element_ids(catalog, self.model))
 
 
-class QuestionSetManager(models.Manager):
+class QuestionSetManager(LockedManagerMixin, models.Manager):
 
     def get_queryset(self):
         return QuestionSetQuerySet(self.model, using=self._db)
@@ -109,17 +155,26 @@ class QuestionSetManager(models.Manager):
         return self.get_queryset().prefetch_elements(**kwargs)
 
 
-class QuestionQuerySet(models.QuerySet):
+class QuestionQuerySet(LockedQuerySetMixin, models.QuerySet):
 
     def prefetch_elements(self, **kwargs):
         return self.prefetch_related(*get_question_prefetch_lookups(**kwargs))
 
+    def get_locked_filter(self):
+        from .models import Page, PageQuestion, QuestionSet, QuestionSetQuestion  # to prevent circular inclusion
+
+        return models.Q(locked=True) | models.Q(models.Exists(
+            PageQuestion.objects.filter(question=models.OuterRef('pk'), page__in=Page.objects.filter_locked())
+        )) | models.Q(models.Exists(
+            QuestionSetQuestion.objects.filter(question=models.OuterRef('pk'),
+                                               questionset__in=QuestionSet.objects.filter_locked())
+        ))
+
     def filter_by_catalog(self, catalog):
-        ids = [descendant.id for descendant in catalog.descendants if isinstance(descendant, self.model)]
-        return self.filter(id__in=ids)
+        return self.filter(id__in=get_catalog_element_ids(catalog, self.model))
 
 
-class QuestionManager(models.Manager):
+class QuestionManager(LockedManagerMixin, models.Manager):
 
     def get_queryset(self):
         return QuestionQuerySet(self.model, using=self._db)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0098_data_migration_for_multisite'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogElement',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('element_type', models.CharField(max_length=16)),
+                ('element_id', models.IntegerField()),
+                ('depth', models.IntegerField(default=0)),
+                ('order', models.IntegerField(default=0)),
+                ('catalog', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='catalog_elements', to='questions.catalog')),
+            ],
+            options={
+                'ordering': ('catalog', 'order'),
+                'indexes': [models.Index(fields=['catalog', 'element_type', 'element_id'], name='questions_c_catalog_477bb1_idx'), models.Index(fields=['element_type', 'element_id'], name='questions_c_element_92816c_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+through_models = (
+    # model name, parent field, parent type, child field, child type
+    ('CatalogSection', 'catalog_id', 'catalog', 'section_id', 'section'),
+    ('SectionPage', 'section_id', 'section', 'page_id', 'page'),
+    ('PageQuestionSet', 'page_id', 'page', 'questionset_id', 'questionset'),
+    ('PageQuestion', 'page_id', 'page', 'question_id', 'question'),
+    ('QuestionSetQuestionSet', 'parent_id', 'questionset', 'questionset_id', 'questionset'),
+    ('QuestionSetQuestion', 'questionset_id', 'questionset', 'question_id', 'question'),
+)
+
+
+def run_data_migration(apps, schema_editor):
+    Catalog = apps.get_model('questions', 'Catalog')
+    CatalogElement = apps.get_model('questions', 'CatalogElement')
+
+    # see rdmo.questions.utils.compute_catalog_elements
+    children = defaultdict(list)
+    for model_name, parent_field, parent_type, child_field, child_type in through_models:
+        through_model = apps.get_model('questions', model_name)
+        for parent_id, child_id, order in through_model.objects.order_by('order', 'id') \
+                                                       .values_list(parent_field, child_field, 'order'):
+            children[(parent_type, parent_id)].append((order, child_type, child_id))
+
+    catalog_elements = []
+
+    def traverse(catalog_id, parent, depth, path, elements):
+        for _order, element_type, element_id in sorted(children[parent], key=lambda child: child[0]):
+            elements.append(CatalogElement(
+                catalog_id=catalog_id,
+                element_type=element_type,
+                element_id=element_id,
+                depth=depth,
+                order=len(elements)
+            ))
+
+            element = (element_type, element_id)
+            if element not in path:
+                traverse(catalog_id, element, depth + 1, (*path, element), elements)
+
+    for catalog_id in Catalog.objects.values_list('id', flat=True):
+        elements = []
+        traverse(catalog_id, ('catalog', catalog_id), 1, (), elements)
+        catalog_elements += elements
+
+    CatalogElement.objects.bulk_create(catalog_elements, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0099_catalogelement'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_data_migration, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from .catalog import Catalog
+from .catalog_element import CatalogElement
 from .catalog_section import CatalogSection
 from .page import Page
 from .page_question import PageQuestion
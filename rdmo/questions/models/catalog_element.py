@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class CatalogElement(models.Model):
+    '''
+    The closure of a catalog: one row for every section, page, questionset and question of the catalog,
+    in the order of Catalog.descendants. The rows are maintained by the handlers in rdmo.questions.handlers,
+    when the through models change, and used by the filter_by_catalog methods of the managers.
+    '''
+
+    catalog = models.ForeignKey(
+        'Catalog', on_delete=models.DO_NOTHING, db_constraint=False, related_name='catalog_elements'
+    )
+    element_type = models.CharField(
+        max_length=16
+    )
+    element_id = models.IntegerField()
+    depth = models.IntegerField(
+        default=0
+    )
+    order = models.IntegerField(
+        default=0
+    )
+
+    class Meta:
+        ordering = ('catalog', 'order')
+        indexes = [
+            models.Index(fields=('catalog', 'element_type', 'element_id')),
+            models.Index(fields=('element_type', 'element_id'))
+        ]
+
+    def __str__(self):
+        return f'{self.catalog_id} / {self.element_type} {self.element_id} [{self.order}]'
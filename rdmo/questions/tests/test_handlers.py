@@ -0,0 +1,148 @@
+import pytest
+
+from ..models import (
+    Catalog,
+    CatalogElement,
+    CatalogSection,
+    Page,
+    PageQuestion,
+    Question,
+    QuestionSet,
+    QuestionSetQuestion,
+    Section,
+    SectionPage,
+)
+from ..utils import compute_catalog_elements
+
+
+def get_catalog_elements(catalog):
+    return [
+        (catalog_element.element_type, catalog_element.element_id)
+        for catalog_element in CatalogElement.objects.filter(catalog=catalog).order_by('order')
+    ]
+
+
+def get_descendants(catalog):
+    catalog = Catalog.objects.get(id=catalog.id)  # to reset the cached properties
+    return [(descendant._meta.model_name, descendant.id) for descendant in catalog.descendants]
+
+
+def assert_catalog_elements(catalog):
+    assert get_catalog_elements(catalog) == get_descendants(catalog)
+
+
+def test_catalog_elements(db):
+    for catalog in Catalog.objects.all():
+        assert_catalog_elements(catalog)
+
+
+def test_catalog_elements_depth(db):
+    catalog = Catalog.objects.first()
+
+    depths = {element_type: set() for element_type in ('section', 'page', 'questionset', 'question')}
+    for catalog_element in CatalogElement.objects.filter(catalog=catalog):
+        depths[catalog_element.element_type].add(catalog_element.depth)
+
+    assert depths['section'] == {1}
+    assert depths['page'] == {2}
+    assert min(depths['questionset']) == 3
+    assert min(depths['question']) == 3
+
+
+def test_catalog_elements_compute(db):
+    catalogs = list(Catalog.objects.all())
+    catalog_elements = compute_catalog_elements([catalog.id for catalog in catalogs])
+
+    for catalog in catalogs:
+        assert [
+            (catalog_element.element_type, catalog_element.element_id)
+            for catalog_element in catalog_elements if catalog_element.catalog_id == catalog.id
+        ] == get_descendants(catalog)
+
+
+def test_catalog_elements_catalog_section(db):
+    catalog = Catalog.objects.first()
+    section = Section.objects.exclude(catalogs=catalog).first()
+
+    catalog_section = CatalogSection.objects.create(catalog=catalog, section=section, order=0)
+    assert ('section', section.id) in get_catalog_elements(catalog)
+    assert_catalog_elements(catalog)
+
+    catalog_section.order = 1000
+    catalog_section.save()
+    assert get_catalog_elements(catalog)[-len(section.descendants) - 1] == ('section', section.id)
+    assert_catalog_elements(catalog)
+
+    catalog_section.delete()
+    assert ('section', section.id) not in get_catalog_elements(catalog)
+    assert_catalog_elements(catalog)
+
+
+def test_catalog_elements_section_page(db):
+    catalog = Catalog.objects.first()
+    section = catalog.elements[0]
+    page = Page.objects.create(uri_prefix='http://example.com/terms', uri_path='test')
+    question = Question.objects.create(uri_prefix='http://example.com/terms', uri_path='test/question')
+
+    SectionPage.objects.create(section=section, page=page, order=0)
+    PageQuestion.objects.create(page=page, question=question, order=0)
+    assert ('page', page.id) in get_catalog_elements(catalog)
+    assert ('question', question.id) in get_catalog_elements(catalog)
+    assert_catalog_elements(catalog)
+
+    # deleting the page removes the page and its descendants
+    page.delete()
+    assert ('page', page.id) not in get_catalog_elements(catalog)
+    assert not CatalogElement.objects.filter(element_type='question', element_id=question.id).exists()
+    assert_catalog_elements(catalog)
+
+
+def test_catalog_elements_questionset_question(db):
+    questionset = QuestionSet.objects.filter(questionset_questions__isnull=False).first()
+    question = Question.objects.create(uri_prefix='http://example.com/terms', uri_path='test/question')
+    catalogs = Catalog.objects.filter(
+        id__in=CatalogElement.objects.filter(element_type='questionset', element_id=questionset.id)
+                                     .values('catalog_id')
+    )
+    assert catalogs
+
+    QuestionSetQuestion.objects.create(questionset=questionset, question=question, order=0)
+    for catalog in catalogs:
+        assert ('question', question.id) in get_catalog_elements(catalog)
+        assert_catalog_elements(catalog)
+
+    question.delete()
+    for catalog in catalogs:
+        assert ('question', question.id) not in get_catalog_elements(catalog)
+        assert_catalog_elements(catalog)
+
+
+def test_catalog_elements_catalog_deleted(db):
+    catalog = Catalog.objects.first()
+    catalog_id = catalog.id
+
+    catalog.delete()
+    assert not CatalogElement.objects.filter(catalog_id=catalog_id).exists()
+
+
+@pytest.mark.parametrize('model', [Page, QuestionSet, Question])
+def test_filter_by_catalog(db, model):
+    for catalog in Catalog.objects.all():
+        descendant_ids = {element_id for element_type, element_id in get_descendants(catalog)
+                          if element_type == model._meta.model_name}
+        assert set(model.objects.filter_by_catalog(catalog).values_list('id', flat=True)) == descendant_ids
+
+
+@pytest.mark.performance
+def test_filter_by_catalog_queries(db, django_assert_num_queries):
+    catalog = Catalog.objects.first()
+
+    # the questions are fetched using one query, without loading the descendants of the catalog
+    with django_assert_num_queries(1):
+        questions = list(Question.objects.filter_by_catalog(catalog))
+
+    with django_assert_num_queries(1):
+        conditions = list(catalog.conditions)
+
+    assert len(questions) == len(Catalog.objects.get(id=catalog.id).questions)
+    assert conditions
@@ -1,7 +1,63 @@
-from ..models import Catalog, Question
+import pytest
+
+from ..models import Catalog, Page, Question, QuestionSet, Section
 
 
 def test_questions_filter_by_catalog(db):
     catalog = Catalog.objects.prefetch_elements().first()
     questions = Question.objects.filter_by_catalog(catalog)
     assert questions.count() == 106
+
+
+def lock_elements():
+    # lock one element of every kind, which is not the first element of its parent
+    catalog = Catalog.objects.get(id=2)
+    catalog.locked = True
+    catalog.save()
+
+    for model in (Section, Page, QuestionSet):
+        instance = model.objects.order_by('-id').first()
+        instance.locked = True
+        instance.save()
+
+    questionset = QuestionSet.objects.exclude(parents=None).first()
+    parent = questionset.parents.first()
+    parent.locked = True
+    parent.save()
+
+
+@pytest.mark.parametrize('model', [Catalog, Section, Page, QuestionSet, Question])
+def test_annotate_is_locked(db, model):
+    lock_elements()
+
+    instances = list(model.objects.annotate_is_locked())
+    assert any(instance.is_locked for instance in instances)
+    assert any(not instance.is_locked for instance in instances)
+
+    for instance in instances:
+        # compare the annotation with the is_locked property, which walks the parents
+        assert instance.is_locked == model.objects.get(id=instance.id).is_locked
+
+    assert set(model.objects.filter_locked().values_list('id', flat=True)) == \
+        {instance.id for instance in instances if instance.is_locked}
+
+
+def test_annotate_is_locked_nested_questionset(db):
+    questionset = QuestionSet.objects.exclude(parents=None).first()
+    questionset.locked = True
+    questionset.save()
+
+    # a locked question set locks its parents, and therefore their questions, see QuestionSet.is_locked
+    for parent in questionset.parents.all():
+        assert QuestionSet.objects.annotate_is_locked().get(id=parent.id).is_locked
+        for question in parent.questions.all():
+            assert Question.objects.annotate_is_locked().get(id=question.id).is_locked
+
+
+@pytest.mark.performance
+def test_annotate_is_locked_queries(db, django_assert_num_queries):
+    lock_elements()
+
+    with django_assert_num_queries(1):
+        questions = list(Question.objects.annotate_is_locked())
+        assert any(question.is_locked for question in questions)
@@ -160,3 +160,31 @@ def test_unique_uri_validator_serializer_update_error(db):
             'uri_prefix': instance.uri_prefix,
             'uri_path': Section.objects.exclude(id=instance.id).first().uri_path
         }, serializer)
+
+
+def test_unique_uri_validator_create_num_queries(db, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        CatalogUniqueURIValidator()({
+            'uri_prefix': settings.DEFAULT_URI_PREFIX,
+            'uri_path': 'test'
+        })
+
+
+def test_unique_uri_validator_fetch_uris(db, django_assert_num_queries):
+    models = CatalogUniqueURIValidator.models
+    question = Question.objects.first()
+    uris = [question.uri, Catalog.objects.first().uri, 'http://example.com/terms/test']
+
+    with django_assert_num_queries(1):
+        fetched_uris = CatalogUniqueURIValidator.fetch_uris(models, uris)
+
+    assert fetched_uris[Question][question.uri] == {question.id}
+    assert fetched_uris[Catalog][question.uri] == set()
+    assert all(not fetched_uris[model]['http://example.com/terms/test'] for model in models)
+
+    # the fetched uris are used by the validator without any further queries
+    with django_assert_num_queries(0), pytest.raises(ValidationError):
+        CatalogUniqueURIValidator(uris=fetched_uris)({
+            'uri_prefix': settings.DEFAULT_URI_PREFIX,
+            'uri_path': question.uri_path
+        })
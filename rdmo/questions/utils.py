@@ -1,7 +1,21 @@
+from collections import defaultdict
+from operator import itemgetter
+
 from rdmo.conditions.models import Condition
 from rdmo.core.utils import is_truthy
 from rdmo.domain.models import Attribute
-from rdmo.questions.models import Page, Question, QuestionSet
+from rdmo.questions.models import (
+    CatalogElement,
+    CatalogSection,
+    Page,
+    PageQuestion,
+    PageQuestionSet,
+    Question,
+    QuestionSet,
+    QuestionSetQuestion,
+    QuestionSetQuestionSet,
+    SectionPage,
+)
 
 
 def get_export_flags(request):
@@ -55,3 +69,97 @@ def get_serializer_context(elements, export_flags):
             ).in_bulk()
         )
     }
+
+
+def compute_catalog_elements(catalog_ids):
+    '''
+    Computes the CatalogElement rows for the given catalogs from the through models,
+    using a few queries per level of the catalogs (instead of one query per element).
+    '''
+    # map (parent_type, parent_id) to a list of (order, child_type, child_id)
+    children = defaultdict(list)
+
+    def fetch_children(through_model, parent_field, parent_type, child_field, child_type, parent_ids):
+        child_ids = set()
+        for parent_id, child_id, order in through_model.objects.filter(**{f'{parent_field}__in': parent_ids}) \
+                                                              .order_by('order', 'id') \
+                                                              .values_list(parent_field, child_field, 'order'):
+            children[(parent_type, parent_id)].append((order, child_type, child_id))
+            child_ids.add(child_id)
+        return child_ids
+
+    section_ids = fetch_children(CatalogSection, 'catalog_id', 'catalog', 'section_id', 'section', catalog_ids)
+    page_ids = fetch_children(SectionPage, 'section_id', 'section', 'page_id', 'page', section_ids)
+
+    # the questionsets come first for the same order, like in Page.elements and QuestionSet.elements
+    questionset_ids = fetch_children(PageQuestionSet, 'page_id', 'page', 'questionset_id', 'questionset', page_ids)
+    fetch_children(PageQuestion, 'page_id', 'page', 'question_id', 'question', page_ids)
+
+    fetched_questionset_ids = set()
+    while questionset_ids - fetched_questionset_ids:
+        parent_ids = questionset_ids - fetched_questionset_ids
+        fetched_questionset_ids |= parent_ids
+        questionset_ids |= fetch_children(QuestionSetQuestionSet, 'parent_id', 'questionset',
+                                          'questionset_id', 'questionset', parent_ids)
+        fetch_children(QuestionSetQuestion, 'questionset_id', 'questionset', 'question_id', 'question', parent_ids)
+
+    catalog_elements = []
+
+    def traverse(catalog_id, parent, depth, path, elements):
+        # traverse the tree depth first, questionsets which contain themselves are not followed
+        for _order, element_type, element_id in sorted(children[parent], key=itemgetter(0)):
+            elements.append(CatalogElement(
+                catalog_id=catalog_id,
+                element_type=element_type,
+                element_id=element_id,
+                depth=depth,
+                order=len(elements)
+            ))
+
+            element = (element_type, element_id)
+            if element not in path:
+                traverse(catalog_id, element, depth + 1, (*path, element), elements)
+
+    for catalog_id in catalog_ids:
+        elements = []
+        traverse(catalog_id, ('catalog', catalog_id), 1, (), elements)
+        catalog_elements += elements
+
+    return catalog_elements
+
+
+def store_catalog_elements(catalog_ids):
+    '''
+    Stores the CatalogElement rows for the given catalogs. Only the rows
+    which changed are deleted and created.
+    '''
+    catalog_ids = set(catalog_ids)
+    if not catalog_ids:
+        return
+
+    def get_key(catalog_element):
+        return (catalog_element.catalog_id, catalog_element.element_type, catalog_element.element_id,
+                catalog_element.depth, catalog_element.order)
+
+    catalog_elements = {
+        get_key(catalog_element): catalog_element
+        for catalog_element in compute_catalog_elements(catalog_ids)
+    }
+    current_catalog_elements = {
+        get_key(catalog_element): catalog_element.id
+        for catalog_element in CatalogElement.objects.filter(catalog_id__in=catalog_ids)
+    }
+
+    CatalogElement.objects.filter(id__in=[
+        catalog_element_id for key, catalog_element_id in current_catalog_elements.items()
+        if key not in catalog_elements
+    ]).delete()
+    CatalogElement.objects.bulk_create([
+        catalog_element for key, catalog_element in catalog_elements.items()
+        if key not in current_catalog_elements
+    ], batch_size=1000)
+
+
+def fetch_catalog_ids_for_element(element_type, element_id):
+    return set(CatalogElement.objects.filter(element_type=element_type, element_id=element_id)
+                                     .values_list('catalog_id', flat=True))
@@ -79,6 +79,9 @@ PROJECT_SEND_ISSUE = True
 
 PROJECT_SEND_INVITE = True
 
+# the tests for the synchronization of tasks and views check the projects right after every change
+PROJECT_SYNC_QUEUE = False
+
 PROJECT_SNAPSHOT_EXPORTS = [
     ('xml', _('RDMO XML'), 'rdmo.projects.exports.RDMOXMLExport'),
 ]